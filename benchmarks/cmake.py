@@ -0,0 +1,79 @@
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Dict
+
+import click
+
+from parsers.cpp_parser import CppParser
+
+COMMANDS = [
+    'find_package(Pkg{i} 1.{i} REQUIRED COMPONENTS core)',
+    'FetchContent_Declare(\n  fetch{i}\n  GIT_REPOSITORY https://github.com/example/fetch{i}.git\n  GIT_TAG v{i}.0.0\n)',
+    'ExternalProject_Add(external{i}\n  URL https://example.com/external{i}-{i}.2.tar.gz\n  CMAKE_ARGS -DBUILD_TESTING=OFF\n)',
+    'CPMAddPackage("gh:example/cpm{i}@{i}.1.0")',
+    'add_library(target{i} STATIC src/a{i}.cpp src/b{i}.cpp)',
+    'target_link_libraries(target{i} PRIVATE Pkg{i}::core)',
+    'if(ENABLE_{i})\n  message(STATUS "feature {i} enabled")\nendif()',
+    '# generated rule {i}',
+]
+
+
+def generate_cmake(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    parts = ['cmake_minimum_required(VERSION 3.14)', 'project(generated LANGUAGES CXX)']
+    count = 2
+    i = 0
+
+    while count < lines:
+        command = rng.choice(COMMANDS).format(i=i)
+        parts.append(command)
+        count += command.count('\n') + 1
+        i += 1
+
+    return '\n'.join(parts) + '\n'
+
+
+def measure(lines: int, repeat: int) -> Dict:
+    with tempfile.TemporaryDirectory(prefix='boomer-cmake-') as work_dir:
+        file_path = os.path.join(work_dir, 'CMakeLists.txt')
+        with open(file_path, 'w') as file:
+            file.write(generate_cmake(lines))
+
+        parser = CppParser(work_dir)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            dependencies = parser.parse_dependencies(file_path)
+            timings.append(time.perf_counter() - start)
+
+        return {
+            'lines': lines,
+            'bytes': os.path.getsize(file_path),
+            'dependencies': len(dependencies),
+            'seconds': min(timings),
+            'lines_per_second': lines / min(timings)
+        }
+
+
+@click.command(help="Time the CMake parser on generated CMakeLists.txt files of growing size")
+@click.option('--lines', 'sizes', type=int, multiple=True, default=[1000, 5000, 20000, 100000], show_default=True,
+              help='CMakeLists.txt size in lines (repeatable)')
+@click.option('--repeat', type=int, default=5, show_default=True, help='Runs per size, the fastest is kept')
+@click.option('-o', '--output', 'output_path', type=click.Path(dir_okay=False),
+              help='Write the results as JSON to this file')
+def main(sizes, repeat, output_path):
+    results = [measure(lines, max(1, repeat)) for lines in sizes]
+
+    text = json.dumps({'cmake': results}, indent=2)
+    if output_path:
+        with open(output_path, 'w') as file:
+            file.write(text + '\n')
+    else:
+        click.echo(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+import json
+import os
+import random
+from typing import Dict, List
+
+SOURCE_EXTENSIONS = {
+    'Python': '.py',
+    'JavaScript': '.js',
+    'Java': '.java',
+    'C++': '.cpp',
+    'C#': '.cs',
+    'Go': '.go',
+    'Rust': '.rs',
+    'PHP': '.php',
+    'Ruby': '.rb'
+}
+
+ECOSYSTEM_DIRECTORIES = {
+    'Python': 'python',
+    'JavaScript': 'web',
+    'Java': 'java',
+    'C++': 'native',
+    'C#': 'dotnet',
+    'Go': 'go',
+    'Rust': 'rust',
+    'PHP': 'php',
+    'Ruby': 'ruby'
+}
+
+
+class SyntheticRepository:
+
+    def __init__(self, path: str, files_per_language: int = 200, manifests_per_ecosystem: int = 10,
+                 dependencies_per_manifest: int = 30, lock_packages: int = 20000, depth: int = 6, seed: int = 0):
+        self.path = path
+        self.files_per_language = files_per_language
+        self.manifests_per_ecosystem = manifests_per_ecosystem
+        self.dependencies_per_manifest = dependencies_per_manifest
+        self.lock_packages = lock_packages
+        self.depth = depth
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def config(self) -> Dict:
+        return {
+            'files_per_language': self.files_per_language,
+            'manifests_per_ecosystem': self.manifests_per_ecosystem,
+            'dependencies_per_manifest': self.dependencies_per_manifest,
+            'lock_packages': self.lock_packages,
+            'depth': self.depth,
+            'seed': self.seed
+        }
+
+    def generate(self) -> str:
+        self._random = random.Random(self.seed)
+
+        for language, extension in SOURCE_EXTENSIONS.items():
+            for i in range(self.files_per_language):
+                self._write(self._nested(ECOSYSTEM_DIRECTORIES[language], i, f"src{i}{extension}"), "\n")
+
+        for i in range(self.manifests_per_ecosystem):
+            self._write_manifests(i)
+
+        self._write_lockfiles()
+
+        return self.path
+
+    def _nested(self, ecosystem_dir: str, index: int, name: str) -> str:
+        levels = [f"level{(index + level) % 3}" for level in range(index % (self.depth + 1))]
+        return os.path.join(ecosystem_dir, f"module{index % 10}", *levels, name)
+
+    def _write(self, rel_path: str, content: str):
+        path = os.path.join(self.path, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(content)
+
+    def _packages(self, count: int, prefix: str = 'pkg') -> List[tuple]:
+        return [(f"{prefix}-{number}",
+                 f"{self._random.randrange(10)}.{self._random.randrange(30)}.{self._random.randrange(100)}")
+                for number in self._random.sample(range(max(100000, count * 2)), count)]
+
+    def _write_manifests(self, i: int):
+        packages = self._packages(self.dependencies_per_manifest)
+
+        def path(language: str, name: str) -> str:
+            return os.path.join(ECOSYSTEM_DIRECTORIES[language], f"service{i}", name)
+
+        self._write(path('Python', 'requirements.txt'),
+                    ''.join(f"{name}=={version}\n" for name, version in packages))
+        self._write(path('JavaScript', 'package.json'),
+                    json.dumps({'name': f"service{i}", 'dependencies': {name: f"^{version}"
+                                                                       for name, version in packages}}, indent=2))
+        self._write(path('Java', 'pom.xml'),
+                    '<project xmlns="http://maven.apache.org/POM/4.0.0"><modelVersion>4.0.0</modelVersion>'
+                    '<dependencies>' + ''.join(
+                        f"<dependency><groupId>org.{name}</groupId><artifactId>{name}</artifactId>"
+                        f"<version>{version}</version></dependency>" for name, version in packages) +
+                    '</dependencies></project>\n')
+        self._write(path('Java', 'build.gradle'),
+                    'dependencies {\n' + ''.join(f"    implementation 'org.{name}:{name}:{version}'\n"
+                                                 for name, version in packages) + '}\n')
+        self._write(path('C++', 'CMakeLists.txt'),
+                    'cmake_minimum_required(VERSION 3.10)\n' + ''.join(f"find_package({name} {version} REQUIRED)\n"
+                                                                     for name, version in packages))
+        self._write(path('C++', 'conanfile.txt'),
+                    '[requires]\n' + ''.join(f"{name}/{version}\n" for name, version in packages))
+        self._write(path('C#', f"Service{i}.csproj"),
+                    '<Project Sdk="Microsoft.NET.Sdk"><ItemGroup>' + ''.join(
+                        f'<PackageReference Include="{name}" Version="{version}" />' for name, version in packages) +
+                    '</ItemGroup></Project>\n')
+        self._write(path('Go', 'go.mod'),
+                    f"module example.com/service{i}\n\ngo 1.21\n\nrequire (\n" +
+                    ''.join(f"\tgithub.com/example/{name} v{version}\n" for name, version in packages) + ")\n")
+        self._write(path('Rust', 'Cargo.toml'),
+                    f'[package]\nname = "service{i}"\nversion = "0.1.0"\n\n[dependencies]\n' +
+                    ''.join(f'{name} = "{version}"\n' for name, version in packages))
+        self._write(path('PHP', 'composer.json'),
+                    json.dumps({'require': {f"example/{name}": f"^{version}" for name, version in packages}}, indent=4))
+        self._write(path('Ruby', 'Gemfile'),
+                    "source 'https://rubygems.org'\n\n" + ''.join(f"gem '{name}', '{version}'\n"
+                                                                   for name, version in packages))
+
+    def _write_lockfiles(self):
+        if not self.lock_packages:
+            return
+
+        packages = self._packages(self.lock_packages, 'lock')
+
+        self._write(os.path.join('web', 'monolith', 'package.json'), json.dumps({'name': 'monolith'}))
+        self._write(os.path.join('web', 'monolith', 'package-lock.json'), json.dumps({
+            'name': 'monolith',
+            'lockfileVersion': 3,
+            'requires': True,
+            'packages': {f"node_modules/{name}": {
+                'version': version,
+                'resolved': f"https://registry.npmjs.org/{name}/-/{name}-{version}.tgz",
+                'integrity': f"sha512-{name}{version}",
+                'dependencies': {dependency: f"^{dependency_version}" for dependency, dependency_version
+                                 in self._random.sample(packages, 3)}
+            } for name, version in packages}
+        }, indent=2))
+        self._write(os.path.join('web', 'legacy', 'yarn.lock'),
+                    '# yarn lockfile v1\n\n\n' + ''.join(
+                        f'{name}@^{version}:\n  version "{version}"\n'
+                        f'  resolved "https://registry.yarnpkg.com/{name}/-/{name}-{version}.tgz"\n'
+                        f'  integrity sha512-{name}{version}\n\n' for name, version in packages))
+        self._write(os.path.join('web', 'workspace', 'package.json'), json.dumps({'name': 'workspace'}))
+        self._write(os.path.join('web', 'workspace', 'pnpm-lock.yaml'), "lockfileVersion: '9.0'\n\npackages:\n\n" + ''.join(
+            f"  {name}@{version}:\n    resolution: {{integrity: sha512-{name}{version}}}\n"
+            f"    engines: {{node: '>=14'}}\n\n" for name, version in packages) + "snapshots:\n\n" + ''.join(
+            f"  {name}@{version}:\n    dependencies:\n      {dependency}: {dependency_version}\n\n"
+            for (name, version), (dependency, dependency_version) in zip(packages, packages[1:] + packages[:1])))
+        self._write(os.path.join('go', 'monolith', 'go.sum'), ''.join(
+            f"github.com/example/{name} v{version} h1:{name}{version}=\n"
+            f"github.com/example/{name} v{version}/go.mod h1:{name}{version}=\n" for name, version in packages))
+        self._write(os.path.join('rust', 'monolith', 'Cargo.lock'), 'version = 3\n\n' + ''.join(
+            f'[[package]]\nname = "{name}"\nversion = "{version}"\n'
+            f'source = "registry+https://github.com/rust-lang/crates.io-index"\n'
+            f'checksum = "{self._random.getrandbits(128):032x}"\n\n' for name, version in packages))
@@ -0,0 +1,193 @@
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import click
+
+from benchmarks.generator import SyntheticRepository
+from helpers.component_index import ComponentIndex
+from helpers.cyclonedx_converter import save_cyclonedx
+from helpers.scanner import RepositoryScanner
+from metadata import __version__
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def repository_size(repo_path: str) -> Dict:
+    files = 0
+    size = 0
+    for root, _, names in os.walk(repo_path):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+
+    return {'files': files, 'bytes': size}
+
+
+def measure(repo_path: str, output_path: str) -> Dict:
+    # the generated go.sum is part of what is being measured
+    scanner = RepositoryScanner(repo_path, module_graph=True)
+
+    start = time.perf_counter()
+    languages = scanner.scan_languages()
+    stages = {'scan_languages': time.perf_counter() - start, 'parsers': {}}
+
+    dependencies = []
+    components = ComponentIndex()
+
+    for language, parser in scanner.get_language_parsers().items():
+        start = time.perf_counter()
+        file_paths = scanner.find_files(parser)
+        find_seconds = time.perf_counter() - start
+
+        by_file = {}
+        parser_dependencies = 0
+        for file_path in file_paths:
+            start = time.perf_counter()
+            file_dependencies = parser.parse_dependencies(file_path)
+            name = os.path.basename(file_path)
+            by_file[name] = by_file.get(name, 0.0) + time.perf_counter() - start
+
+            parser_dependencies += len(file_dependencies)
+            dependencies.extend(file_dependencies)
+            rel_path = os.path.relpath(file_path, repo_path).replace(os.sep, '/')
+            for dependency in file_dependencies:
+                components.add(dependency, rel_path)
+
+        stages['parsers'][language] = {
+            'find_dependency_files': find_seconds,
+            'parse_dependencies': sum(by_file.values()),
+            'files': len(file_paths),
+            'dependencies': parser_dependencies,
+            'by_file': by_file
+        }
+
+    results = {'languages': languages, 'dependencies': dependencies, 'components': components}
+
+    start = time.perf_counter()
+    save_cyclonedx(results, repo_path, output_path)
+    stages['save_cyclonedx'] = time.perf_counter() - start
+    stages['components'] = len(components)
+
+    return stages
+
+
+def total_seconds(stages: Dict) -> float:
+    return stages['scan_languages'] + stages['save_cyclonedx'] + sum(
+        parser['find_dependency_files'] + parser['parse_dependencies'] for parser in stages['parsers'].values())
+
+
+def best_of(runs):
+    if isinstance(runs[0], dict):
+        return {key: best_of([run[key] for run in runs]) for key in runs[0]}
+    if isinstance(runs[0], float):
+        return min(runs)
+
+    return runs[0]
+
+
+def flatten(stages: Dict, prefix: str = '') -> Dict[str, float]:
+    timings = {}
+    for key, value in stages.items():
+        if isinstance(value, dict):
+            timings.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, float):
+            timings[f"{prefix}{key}"] = value
+
+    return timings
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> int:
+    current = flatten(report['stages'])
+    previous = flatten(baseline['stages'])
+    regressions = 0
+
+    click.echo(f"{'stage':<60} {'baseline':>10} {'current':>10} {'ratio':>7}", err=True)
+    for stage, seconds in current.items():
+        if stage not in previous:
+            continue
+        ratio = seconds / previous[stage] if previous[stage] else 1.0
+        marker = ''
+        if ratio > threshold and seconds - previous[stage] > 0.01:
+            regressions += 1
+            marker = '  <-- slower'
+        click.echo(f"{stage:<60} {previous[stage]:>10.4f} {seconds:>10.4f} {ratio:>7.2f}{marker}", err=True)
+
+    return regressions
+
+
+@click.command(help="Generate a synthetic repository and time every boomer stage")
+@click.option('--repo', 'repo_path', type=click.Path(exists=True, file_okay=False),
+              help='Benchmark an existing repository instead of generating one')
+@click.option('-o', '--output', 'output_path', type=click.Path(dir_okay=False),
+              help='Write the results as JSON to this file')
+@click.option('--files-per-language', type=int, default=200, show_default=True)
+@click.option('--manifests-per-ecosystem', type=int, default=10, show_default=True)
+@click.option('--dependencies-per-manifest', type=int, default=30, show_default=True)
+@click.option('--lock-packages', type=int, default=20000, show_default=True,
+              help='Packages in each of the large lockfiles')
+@click.option('--depth', type=int, default=6, show_default=True, help='Maximum directory nesting')
+@click.option('--seed', type=int, default=0, show_default=True)
+@click.option('--repeat', type=int, default=3, show_default=True, help='Runs per stage, the fastest is kept')
+@click.option('--keep', is_flag=True, help='Keep the generated repository')
+@click.option('--compare', 'baseline_path', type=click.Path(exists=True, dir_okay=False),
+              help='Results from an earlier run to compare against')
+@click.option('--threshold', type=float, default=1.2, show_default=True,
+              help='Slowdown ratio reported as a regression when comparing')
+def main(repo_path, output_path, files_per_language, manifests_per_ecosystem, dependencies_per_manifest,
+         lock_packages, depth, seed, repeat, keep, baseline_path, threshold):
+    work_dir = tempfile.mkdtemp(prefix='boomer-bench-')
+    report = {'boomer': __version__, 'commit': git_commit(), 'python': platform.python_version(),
+              'platform': platform.platform()}
+
+    try:
+        if repo_path:
+            report['repository'] = {'path': os.path.abspath(repo_path)}
+        else:
+            repository = SyntheticRepository(os.path.join(work_dir, 'repo'), files_per_language,
+                                             manifests_per_ecosystem, dependencies_per_manifest,
+                                             lock_packages, depth, seed)
+            start = time.perf_counter()
+            repo_path = repository.generate()
+            report['repository'] = {'config': repository.config(), 'generate': time.perf_counter() - start}
+
+        report['repository'].update(repository_size(repo_path))
+        report['repeat'] = repeat
+
+        bom_path = os.path.join(work_dir, 'bom.json')
+        report['stages'] = best_of([measure(repo_path, bom_path) for _ in range(max(1, repeat))])
+        report['total'] = total_seconds(report['stages'])
+    finally:
+        if keep:
+            click.echo(f"Repository kept in {work_dir}", err=True)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if output_path:
+        with open(output_path, 'w') as file:
+            file.write(text + '\n')
+    else:
+        click.echo(text)
+
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        if compare(report, baseline, threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,10 @@
 import sys
 
 import click
-from loguru import logger
 
+from consts.cache import DEFAULT_MAX_SIZE, DEFAULT_MEMORY_ENTRIES
 from consts.file_extensions import LANGUAGE_EXTENSIONS
-from helpers.cyclonedx_converter import save_cyclonedx
-from helpers.log import logs
-from helpers.scanner import RepositoryScanner
+from helpers.lockfile_policy import PREFER_CHOICES
 from metadata import __version__, __license__, __title__, __description__, __copyrights__, __bmw__
 
 
@@ -18,42 +16,178 @@ def cli():
     pass
 
 
+def scan_options(command):
+    options = [
+        click.option('--include', 'include', multiple=True,
+                     help='Only scan paths matching this gitignore-style pattern (repeatable)'),
+        click.option('--exclude', 'exclude', multiple=True,
+                     help='Skip paths matching this gitignore-style pattern (repeatable)'),
+        click.option('--max-depth', 'max_depth', type=click.IntRange(min=0), default=None,
+                     help='Maximum directory depth to descend into (0 scans only the top level)'),
+        click.option('--cache-dir', 'cache_dir', type=click.Path(file_okay=False),
+                     help='Directory for the persistent parse cache'),
+        click.option('--cache-size', 'cache_size', type=int, default=DEFAULT_MAX_SIZE // (1024 * 1024),
+                     show_default=True, help='Parse cache size limit in MB'),
+        click.option('--compact', 'compact', is_flag=True,
+                     help='Write the BOM without indentation'),
+        click.option('--prefer', 'prefer', type=click.Choice(PREFER_CHOICES), default='lock', show_default=True,
+                     help='Which file to trust when a directory has both a manifest and its lockfile'),
+        click.option('--module-graph', 'module_graph', is_flag=True,
+                     help='Also read go.sum to report every module version in the Go module graph'),
+    ]
+
+    for option in reversed(options):
+        command = option(command)
+
+    return command
+
+
 @cli.command(help="Scan repository for CycloneDX BOM")
 @click.argument('repo_path', type=click.Path(exists=True, file_okay=False, dir_okay=True))
 @click.option('-o', '--output', 'output_path',
               type=click.Path(),
               help='Path to output file')
-def scan(repo_path, output_path):
+@click.option('-j', '--jobs', 'jobs', type=click.IntRange(min=0), default=1, show_default=True,
+              help='Number of parser processes (0 uses every CPU)')
+@click.option('--since', 'since',
+              help='Only re-parse files changed since this git commit (requires --previous)')
+@click.option('--previous', 'previous_path', type=click.Path(exists=True, dir_okay=False),
+              help='BOM from an earlier scan to patch when using --since')
+@click.option('--profile', 'profile', is_flag=True,
+              help='Print time per stage and parser, the slowest files, bytes read and peak memory '
+                   '(memory tracing slows the scan down)')
+@click.option('--trace-file', 'trace_path', type=click.Path(dir_okay=False),
+              help='Write a Chrome trace-event timeline of the scan to this file')
+@scan_options
+def scan(repo_path, output_path, jobs, since, previous_path, profile, trace_path, include, exclude, max_depth,
+         cache_dir, cache_size, compact, prefer, module_graph):
+    if bool(since) != bool(previous_path):
+        raise click.UsageError("--since and --previous must be used together")
+
+    from helpers.log import logs
+    from helpers.parse_cache import ParseCache
+    from helpers.profiler import Profiler, activate, format_summary
+    from helpers.runner import run_scan
+
     logs.info(f"{__title__} START ENGINE")
     logs.info("WROOM WROOM")
     logs.info(__bmw__)
 
-    scanner = RepositoryScanner(repo_path)
+    cache = ParseCache(cache_dir, cache_size * 1024 * 1024) if cache_dir else None
 
-    logs.info("Determining languages...")
-    languages = scanner.scan_languages()
-    logs.info(f"Found languages: {languages}")
+    profiler = None
+    if profile or trace_path:
+        profiler = Profiler(trace_memory=profile)
+        profiler.start()
+        activate(profiler)
 
-    logs.info("Scanning dependencies...")
-    scanner.scan_dependencies()
-
-    logs.info("Convert to cyclonedx...")
     try:
-        save_cyclonedx(scanner.get_results(), repo_path, output_path)
+        run_scan(repo_path, output_path, include=include, exclude=exclude, max_depth=max_depth, jobs=jobs,
+                 cache=cache, prefer=prefer, compact=compact, since=since, previous_path=previous_path,
+                 module_graph=module_graph)
 
         logs.success(f"CycloneDX BOM saved to {output_path}")
     except Exception as e:
-        logger.error(f"Error exporting results: {e}")
+        logs.error(f"Error scanning {repo_path}: {e}")
         return 1
+    finally:
+        if profiler:
+            activate(None)
+            profiler.stop()
+            if profile:
+                for line in format_summary(profiler.summary()):
+                    logs.info(line)
+            if trace_path:
+                profiler.write_trace(trace_path)
+                logs.info(f"Trace written to {trace_path}")
 
     return 0
 
 
-@cli.command(help="List supported languages")
-def languages():
-    click.echo("Supported languages:")
-    for language in sorted(LANGUAGE_EXTENSIONS.keys()):
-        click.echo(f"  - {language}")
+@cli.command(name='scan-many', help="Scan many repositories, writing one CycloneDX BOM per repository")
+@click.argument('source', type=click.Path(exists=True))
+@click.option('-o', '--output-dir', 'output_dir', type=click.Path(file_okay=False), required=True,
+              help='Directory for the BOMs and the summary manifest')
+@click.option('-j', '--jobs', 'jobs', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Number of repositories scanned in parallel (0 uses every CPU)')
+@scan_options
+def scan_many_command(source, output_dir, jobs, include, exclude, max_depth, cache_dir, cache_size, compact, prefer,
+                      module_graph):
+    from helpers.batch import read_repositories, scan_many
+    from helpers.log import logs
+
+    logs.info(f"{__title__} START ENGINE")
+    logs.info("WROOM WROOM")
+    logs.info(__bmw__)
+
+    repositories = read_repositories(source)
+    logs.info(f"Scanning {len(repositories)} repositories...")
+
+    summary = scan_many(repositories, output_dir, jobs=jobs, include=include, exclude=exclude,
+                        max_depth=max_depth, cache_dir=cache_dir, cache_size=cache_size * 1024 * 1024,
+                        compact=compact, prefer=prefer, module_graph=module_graph)
+
+    logs.success(f"{summary['succeeded']} BOMs saved to {output_dir}, {summary['failed']} failed")
+
+    return 1 if summary['failed'] else 0
+
+
+@cli.command(help="Run a resident scan daemon on a unix socket or a localhost port")
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help='Listen on this unix socket instead of TCP')
+@click.option('--port', 'port', type=int, default=8765, show_default=True,
+              help='Localhost TCP port to listen on')
+@click.option('--cache-dir', 'cache_dir', type=click.Path(file_okay=False),
+              help='Directory for the persistent parse cache (kept in memory as well)')
+@click.option('--cache-size', 'cache_size', type=int, default=DEFAULT_MAX_SIZE // (1024 * 1024), show_default=True,
+              help='Parse cache size limit in MB')
+@click.option('--memory-entries', 'memory_entries', type=click.IntRange(min=0), default=DEFAULT_MEMORY_ENTRIES,
+              show_default=True, help='Parsed files kept in memory between scans (0 disables the memory cache)')
+@click.option('--token', 'token', envvar='BOOMER_TOKEN',
+              help='Token clients must send as "Authorization: Bearer <token>" (generated for TCP when not set)')
+def serve(socket_path, port, cache_dir, cache_size, memory_entries, token):
+    from helpers.daemon import serve as run_daemon
+    from helpers.log import logs
+
+    logs.info(f"{__title__} START ENGINE")
+    logs.info(__bmw__)
+
+    try:
+        run_daemon(socket_path=socket_path, port=port, cache_dir=cache_dir, cache_size=cache_size * 1024 * 1024,
+                   memory_entries=memory_entries, token=token)
+    except FileExistsError as e:
+        raise click.ClickException(str(e))
+
+
+@cli.command(help="List supported languages, or count the languages used in a repository")
+@click.argument('repo_path', required=False, type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.option('--detect', 'detect', is_flag=True,
+              help='Only report which languages are present, stopping as soon as all are found')
+@click.option('--per-directory', 'per_directory', is_flag=True,
+              help='Report file counts for every directory')
+def languages(repo_path, detect, per_directory):
+    if not repo_path:
+        click.echo("Supported languages:")
+        for language in sorted(LANGUAGE_EXTENSIONS.keys()):
+            click.echo(f"  - {language}")
+        return
+
+    from helpers.census import LanguageCensus
+    from helpers.walker import RepositoryWalker
+
+    census = LanguageCensus(RepositoryWalker(repo_path))
+
+    if detect:
+        for language in sorted(census.detect()):
+            click.echo(f"  - {language}")
+    elif per_directory:
+        for directory, counters in sorted(census.count_per_directory().items()):
+            click.echo(f"{directory}:")
+            for language, count in sorted(counters.items(), key=lambda item: (-item[1], item[0])):
+                click.echo(f"  - {language}: {count}")
+    else:
+        for language, count in sorted(census.count().items(), key=lambda item: (-item[1], item[0])):
+            click.echo(f"  - {language}: {count}")
 
 
 @cli.command(help="Show version information")
@@ -0,0 +1,3 @@
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 5000
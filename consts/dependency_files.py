@@ -1,11 +1,39 @@
 DEPENDENCY_FILES = {
-    'Python': ['requirements.txt', 'Pipfile', 'Pipfile.lock', 'pyproject.toml', 'setup.py'],
-    'JavaScript': ['package.json', 'package-lock.json', 'yarn.lock', 'npm-shrinkwrap.json'],
-    'Java': ['pom.xml', 'build.gradle', 'build.gradle.kts', '.gradle'],
+    'Python': ['requirements.txt', 'Pipfile', 'Pipfile.lock', 'pyproject.toml', 'setup.py', 'poetry.lock', 'uv.lock',
+               'pdm.lock'],
+    'JavaScript': ['package.json', 'package-lock.json', 'yarn.lock', 'npm-shrinkwrap.json', 'pnpm-lock.yaml'],
+    'Java': ['pom.xml', '*.gradle', '*.gradle.kts', 'gradle.lockfile'],
     'C++': ['CMakeLists.txt', 'conanfile.txt', 'vcpkg.json'],
-    'C#': ['*.csproj', 'packages.config', '*.sln'],
+    'C#': ['*.csproj', 'packages.config', '*.sln', 'packages.lock.json', 'project.assets.json'],
     'Go': ['go.mod', 'go.sum', 'Gopkg.toml', 'Gopkg.lock'],
     'Rust': ['Cargo.toml', 'Cargo.lock'],
     'PHP': ['composer.json', 'composer.lock'],
     'Ruby': ['Gemfile', 'Gemfile.lock']
-}
\ No newline at end of file
+}
+
+LOCK_FILES = {
+    'Pipfile': ['Pipfile.lock'],
+    'pyproject.toml': ['poetry.lock', 'uv.lock', 'pdm.lock'],
+    'package.json': ['package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml'],
+    'go.mod': ['go.sum', 'vendor/modules.txt'],
+    'Cargo.toml': ['Cargo.lock'],
+    'composer.json': ['composer.lock'],
+    'Gemfile': ['Gemfile.lock'],
+    'build.gradle': ['gradle.lockfile'],
+    'build.gradle.kts': ['gradle.lockfile'],
+    '*.csproj': ['packages.lock.json', 'obj/project.assets.json']
+}
+
+SHARED_INPUTS = {
+    '*.versions.toml': ['*.gradle', '*.gradle.kts'],
+    'pom.xml': ['pom.xml'],
+    'Directory.Build.props': ['*.csproj'],
+    'Directory.Packages.props': ['*.csproj'],
+    'go.work': ['go.mod'],
+    'Cargo.toml': ['Cargo.toml'],
+    'Cargo.lock': ['Cargo.toml'],
+    '*.txt': ['requirements.txt']
+}
+
+# Only read when the full module graph is requested
+MODULE_GRAPH_FILES = ['go.sum']
\ No newline at end of file
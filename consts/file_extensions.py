@@ -8,4 +8,7 @@ LANGUAGE_EXTENSIONS = {
     'Rust': ['.rs'],
     'PHP': ['.php'],
     'Ruby': ['.rb']
-}
\ No newline at end of file
+}
+
+EXTENSION_LANGUAGES = {extension: language for language, extensions in LANGUAGE_EXTENSIONS.items()
+                       for extension in extensions}
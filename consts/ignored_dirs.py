@@ -0,0 +1,9 @@
+PRUNED_DIRECTORIES = {
+    '.git', '.hg', '.svn',
+    'node_modules', 'bower_components',
+    'vendor',
+    'target', 'build',
+    '.venv', 'venv', '__pycache__', '.tox'
+}
+
+IGNORE_FILES = ['.gitignore', '.boomerignore']
@@ -0,0 +1,182 @@
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Tuple
+
+from helpers.executor import resolve_jobs
+from helpers.log import logs
+from helpers.parse_cache import DEFAULT_MAX_SIZE, ParseCache
+from helpers.runner import run_scan
+
+SUMMARY_FILE = 'summary.json'
+
+_started = None
+
+
+def read_repositories(source: str) -> List[str]:
+    if os.path.isdir(source):
+        return sorted(entry.path for entry in os.scandir(source)
+                      if entry.is_dir() and not entry.name.startswith('.'))
+
+    with open(source, 'r') as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith('#')]
+
+
+def estimate_size(repo_path: str) -> int:
+    # roughly one file per 100 bytes of git index; without git, count entries two levels deep
+    try:
+        return os.stat(os.path.join(repo_path, '.git', 'index')).st_size // 100
+    except OSError:
+        pass
+
+    size = 0
+    try:
+        for entry in os.scandir(repo_path):
+            size += 1
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    size += sum(1 for _ in os.scandir(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return 0
+
+    return size
+
+
+def _output_paths(repositories: List[str], output_dir: str) -> List[str]:
+    used = {os.path.splitext(SUMMARY_FILE)[0]}
+    paths = []
+
+    for repo_path in repositories:
+        name = base = os.path.basename(os.path.normpath(repo_path)) or 'repository'
+        suffix = 2
+        while name in used:
+            name = f"{base}-{suffix}"
+            suffix += 1
+        used.add(name)
+        paths.append(os.path.join(output_dir, f"{name}.json"))
+
+    return paths
+
+
+def _track_started(queue):
+    global _started
+    _started = queue
+
+
+def _scan_repository(item: Tuple[str, str, Dict]) -> Dict:
+    repo_path, output_path, options = item
+    if _started is not None:
+        _started.put(output_path)
+
+    options = dict(options)
+    cache_dir = options.pop('cache_dir', None)
+    cache_size = options.pop('cache_size', DEFAULT_MAX_SIZE)
+    entry = {'path': repo_path, 'output': output_path}
+
+    start = time.perf_counter()
+    try:
+        if not os.path.isdir(repo_path):
+            raise NotADirectoryError(f"{repo_path} is not a directory")
+
+        cache = ParseCache(cache_dir, cache_size) if cache_dir else None
+        summary = run_scan(repo_path, output_path, cache=cache, **options)
+        entry.update(status='ok', languages=summary['languages'], components=summary['components'])
+    except Exception as e:
+        entry.update(status='failed', error=f"{e.__class__.__name__}: {e}")
+
+    entry['duration'] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+def _failed_entry(item: Tuple[str, str, Dict], error: str) -> Dict:
+    return {'path': item[0], 'output': item[1], 'status': 'failed', 'error': error, 'duration': None}
+
+
+def _scan_pool(items: Dict[int, Tuple[str, str, Dict]], workers: int, report) -> Tuple[List[int], List[int]]:
+    started = multiprocessing.SimpleQueue()
+    crashed = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_track_started, initargs=(started,)) as executor:
+        futures = {executor.submit(_scan_repository, item): index for index, item in items.items()}
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                entry = future.result()
+            except BrokenProcessPool:
+                crashed.append(index)
+                continue
+            except Exception as e:
+                entry = _failed_entry(items[index], f"{e.__class__.__name__}: {e}")
+            report(index, entry)
+
+    # a dead worker takes the whole pool down; only the repositories that had started can be the cause
+    running = set()
+    while not started.empty():
+        running.add(started.get())
+    suspects = [index for index in crashed if items[index][1] in running]
+
+    return crashed, suspects
+
+
+def scan_many(repositories: List[str], output_dir: str, jobs: int = 0, **options) -> Dict:
+    os.makedirs(output_dir, exist_ok=True)
+
+    outputs = _output_paths(repositories, output_dir)
+    order = sorted(range(len(repositories)), key=lambda i: estimate_size(repositories[i]), reverse=True)
+    entries = [None] * len(repositories)
+    jobs = resolve_jobs(jobs)
+
+    def report(index: int, entry: Dict):
+        entries[index] = entry
+        done = sum(1 for e in entries if e is not None)
+        if entry['status'] == 'ok':
+            logs.info(f"[{done}/{len(entries)}] {entry['path']}: {entry['components']} components "
+                      f"in {entry['duration']}s")
+        else:
+            logs.error(f"[{done}/{len(entries)}] {entry['path']}: {entry['error']}")
+
+    if jobs == 1 or len(repositories) < 2:
+        for index in order:
+            report(index, _scan_repository((repositories[index], outputs[index], options)))
+    else:
+        queued = {index: (repositories[index], outputs[index], options) for index in order}
+        isolated = []
+
+        while queued or isolated:
+            if queued:
+                items, queued = queued, {}
+            else:
+                index = isolated.pop(0)
+                items = {index: (repositories[index], outputs[index], options)}
+
+            crashed, suspects = _scan_pool(items, min(jobs, len(items)), report)
+            if not crashed:
+                continue
+
+            logs.warning(f"A scan worker crashed, restarting the pool for {len(crashed)} unfinished repositories")
+            if not suspects or len(items) == 1:
+                suspects = crashed
+
+            # with several scans in flight, each suspect is rerun on its own to find the one that crashes
+            if len(suspects) == 1:
+                report(suspects[0], _failed_entry(items[suspects[0]], "Worker process crashed"))
+            else:
+                isolated.extend(suspects)
+            queued.update((index, items[index]) for index in crashed if index not in suspects)
+
+    summary = {
+        'succeeded': sum(1 for entry in entries if entry['status'] == 'ok'),
+        'failed': sum(1 for entry in entries if entry['status'] != 'ok'),
+        'repositories': entries
+    }
+
+    with open(os.path.join(output_dir, SUMMARY_FILE), 'w') as file:
+        json.dump(summary, file, indent=2)
+
+    return summary
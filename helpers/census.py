@@ -0,0 +1,72 @@
+import os
+from typing import Dict, Set
+
+from consts.file_extensions import EXTENSION_LANGUAGES
+from helpers.walker import RepositoryWalker
+
+
+def file_extension(name: str) -> str:
+    dot = name.rfind('.')
+    if dot <= 0 or (name[0] == '.' and not name[:dot].strip('.')):
+        return ''
+
+    return name[dot:].lower()
+
+
+class LanguageCensus:
+
+    def __init__(self, walker: RepositoryWalker):
+        self.walker = walker
+
+    def count(self) -> Dict[str, int]:
+        extension_counts = {}
+        for _, files in self.walker.walk():
+            for name in files:
+                file_ext = file_extension(name)
+                extension_counts[file_ext] = extension_counts.get(file_ext, 0) + 1
+
+        return languages_from_extensions(extension_counts)
+
+    def count_per_directory(self) -> Dict[str, Dict[str, int]]:
+        prefix_len = len(self.walker.repo_path.rstrip(os.sep)) + 1
+        directories = {}
+
+        for root, files in self.walker.walk():
+            counters = {}
+            for name in files:
+                language = EXTENSION_LANGUAGES.get(file_extension(name))
+                if language:
+                    counters[language] = counters.get(language, 0) + 1
+
+            if counters:
+                rel_root = root[prefix_len:].replace(os.sep, '/')
+                directories[rel_root or '.'] = counters
+
+        return directories
+
+    def detect(self) -> Set[str]:
+        remaining = set(EXTENSION_LANGUAGES.values())
+        found = set()
+
+        for _, files in self.walker.walk():
+            for name in files:
+                language = EXTENSION_LANGUAGES.get(file_extension(name))
+                if language in remaining:
+                    remaining.discard(language)
+                    found.add(language)
+                    if not remaining:
+                        return found
+
+        return found
+
+
+def languages_from_extensions(extension_counts: Dict[str, int],
+                              extension_languages: Dict[str, str] = None) -> Dict[str, int]:
+    extension_languages = extension_languages or EXTENSION_LANGUAGES
+    counters = {}
+    for file_ext, count in extension_counts.items():
+        language = extension_languages.get(file_ext)
+        if language:
+            counters[language] = counters.get(language, 0) + count
+
+    return counters
@@ -0,0 +1,58 @@
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_PYTHON_SEPARATORS = re.compile(r'[-_.]+')
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    if not isinstance(name, str):
+        return name
+
+    if ecosystem == 'Python':
+        return _PYTHON_SEPARATORS.sub('-', name).lower()
+
+    if ecosystem == 'Rust':
+        return name.replace('_', '-').lower()
+
+    if ecosystem in ('C#', 'PHP'):
+        return name.lower()
+
+    return name
+
+
+class ComponentIndex:
+
+    def __init__(self):
+        self._components: Dict[Tuple[str, str, str], Tuple[Tuple[str, str, str], Dict[str, None]]] = {}
+
+    @classmethod
+    def from_dependencies(cls, dependencies: Iterable[Tuple[str, str, str]], source: str = None) -> 'ComponentIndex':
+        index = cls()
+        for dependency in dependencies:
+            index.add(dependency, source)
+
+        return index
+
+    def add(self, dependency: Tuple[str, str, str], source: str = None):
+        ecosystem, name, version = dependency
+        key = (ecosystem, normalize_name(ecosystem, name), version)
+
+        entry = self._components.get(key)
+        if entry is None:
+            entry = self._components[key] = (dependency, {})
+
+        if source is not None:
+            entry[1][source] = None
+
+    def get(self, dependency: Tuple[str, str, str]) -> Optional[Tuple[str, str, str]]:
+        ecosystem, name, version = dependency
+        entry = self._components.get((ecosystem, normalize_name(ecosystem, name), version))
+
+        return entry[0] if entry else None
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __iter__(self) -> Iterator[Tuple[Tuple[str, str, str], List[str]]]:
+        for dependency, sources in self._components.values():
+            yield dependency, list(sources)
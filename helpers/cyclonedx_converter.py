@@ -2,35 +2,110 @@ import datetime
 import json
 import os
 import uuid
+from typing import Dict, Iterator, List, TextIO
 
+from helpers.component_index import ComponentIndex
 from metadata import __title__, __vendor__, __version__
 
+SOURCE_PROPERTY = "boomer:source"
 
-def save_cyclonedx(results, repo_path, output_path):
-    bom = {
-        "bomFormat": "CycloneDX",
-        "specVersion": "1.4",
-        "serialNumber": f"urn:uuid:{uuid.uuid4()}",
-        "version": 1,
-        "metadata": {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "tools": [
-                {
-                    "vendor": __title__,
-                    "name": __vendor__,
-                    "version": __version__
-                }
-            ]
-        },
-        "components": []
+
+class CycloneDXWriter:
+
+    def __init__(self, file: TextIO, compact: bool = False):
+        self.file = file
+        self.compact = compact
+        self._components = 0
+
+    def _dumps(self, data: Dict) -> str:
+        if self.compact:
+            return json.dumps(data, separators=(',', ':'))
+
+        return json.dumps(data, indent=2)
+
+    def write_header(self):
+        header = {
+            "bomFormat": "CycloneDX",
+            "specVersion": "1.4",
+            "serialNumber": f"urn:uuid:{uuid.uuid4()}",
+            "version": 1,
+            "metadata": {
+                "timestamp": datetime.datetime.now().isoformat(),
+                "tools": [
+                    {
+                        "vendor": __title__,
+                        "name": __vendor__,
+                        "version": __version__
+                    }
+                ]
+            }
+        }
+
+        if self.compact:
+            self.file.write(self._dumps(header)[:-1] + ',"components":[')
+        else:
+            self.file.write(self._dumps(header)[:-2] + ',\n  "components": [\n')
+
+    def write_component(self, component: Dict):
+        if self.compact:
+            if self._components:
+                self.file.write(',')
+            self.file.write(self._dumps(component))
+        else:
+            if self._components:
+                self.file.write(',\n')
+            self.file.write('    ' + self._dumps(component).replace('\n', '\n    '))
+
+        self._components += 1
+
+    def write_footer(self, dependencies: List[Dict] = None):
+        if self.compact:
+            self.file.write(']')
+            if dependencies:
+                self.file.write(',"dependencies":' + json.dumps(dependencies, separators=(',', ':')))
+            self.file.write('}')
+        else:
+            self.file.write('\n  ]')
+            if dependencies:
+                self.file.write(',\n  "dependencies": ' + json.dumps(dependencies, indent=2).replace('\n', '\n  '))
+            self.file.write('\n}')
+
+
+def project_component(results, repo_path) -> Dict:
+    component = {
+        "type": "application",
+        "bom-ref": "project",
+        "name": os.path.basename(repo_path) if repo_path.rstrip('/') else "unknown-project",
+        "properties": []
     }
 
-    for lang, lib, ver in results['dependencies']:
-        # component_uuid = str(uuid.uuid4())
+    for language, count in results['languages'].items():
+        component["properties"].append({
+            "name": f"files.language.{language.lower()}",
+            "value": str(count)
+        })
+
+    return component
+
+
+def bom_ref(dependency) -> str:
+    lang, lib, ver = dependency
+    return f"pkg:{lang.lower()}/{lib}@{ver}"
+
+
+def _components(results) -> ComponentIndex:
+    components = results.get('components')
+    if components is None:
+        components = ComponentIndex.from_dependencies(results['dependencies'])
 
+    return components
+
+
+def library_components(results) -> Iterator[Dict]:
+    for (lang, lib, ver), sources in _components(results):
         component = {
             "type": "library",
-            "bom-ref": f"pkg:{lang.lower()}/{lib}@{ver}",
+            "bom-ref": bom_ref((lang, lib, ver)),
             "name": lib,
             "version": ver,
             "purl": f"pkg:{lang.lower()}/{lib}@{ver}",
@@ -42,22 +117,33 @@ def save_cyclonedx(results, repo_path, output_path):
             ]
         }
 
-        bom["components"].append(component)
+        for source in sources:
+            component["properties"].append({
+                "name": SOURCE_PROPERTY,
+                "value": source
+            })
 
-    project_component = {
-        "type": "application",
-        "bom-ref": "project",
-        "name": os.path.basename(repo_path) if repo_path.rstrip('/') else "unknown-project",
-        "properties": []
-    }
+        yield component
 
-    for language, count in results['languages'].items():
-        project_component["properties"].append({
-            "name": f"files.language.{language.lower()}",
-            "value": str(count)
-        })
 
-    bom["components"].insert(0, project_component)
+def dependency_graph(results) -> List[Dict]:
+    components = _components(results)
+    depends_on = {}
+    for parent, child in results.get('edges') or ():
+        parent, child = components.get(parent), components.get(child)
+        if parent and child:
+            depends_on.setdefault(bom_ref(parent), {})[bom_ref(child)] = None
+
+    return [{"ref": ref, "dependsOn": list(children)} for ref, children in depends_on.items()]
+
 
+def save_cyclonedx(results, repo_path, output_path, compact=False):
     with open(output_path, 'w') as f:
-        json.dump(bom, f, indent=2)
+        writer = CycloneDXWriter(f, compact=compact)
+        writer.write_header()
+        writer.write_component(project_component(results, repo_path))
+
+        for component in library_components(results):
+            writer.write_component(component)
+
+        writer.write_footer(dependency_graph(results))
\ No newline at end of file
@@ -0,0 +1,232 @@
+import hmac
+import json
+import os
+import secrets
+import signal
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from consts.cache import DEFAULT_MAX_SIZE, DEFAULT_MEMORY_ENTRIES
+from helpers.lockfile_policy import PREFER_CHOICES
+from helpers.log import logs
+from helpers.parse_cache import ParseCache
+from helpers.runner import run_scan
+
+# request options mirror the scan command line options
+SCAN_OPTIONS = {'include': list, 'exclude': list, 'max_depth': int, 'jobs': int, 'prefer': str, 'compact': bool,
+                'since': str, 'previous_path': str, 'module_graph': bool}
+LOCAL_HOSTS = ('127.0.0.1', 'localhost')
+
+
+class ScanService:
+
+    def __init__(self, cache: ParseCache):
+        self.cache = cache
+        self.started = time.time()
+        self.scans_served = 0
+        self.scans_failed = 0
+        self.stage_seconds = {}
+        self._scan_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def scan(self, request: Dict) -> Dict:
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+
+        repo_path = request.get('path')
+        output_path = request.get('output')
+        options = request.get('options') or {}
+
+        if not isinstance(repo_path, str) or not os.path.isdir(repo_path):
+            raise ValueError(f"'path' must be an existing directory, got {repo_path!r}")
+        if not isinstance(output_path, str) or not output_path:
+            raise ValueError("'output' is required")
+        _check_options(options)
+
+        # scans share the parse cache, so they run one at a time; /stats only waits for the counters
+        with self._scan_lock:
+            try:
+                summary = run_scan(repo_path, output_path, cache=self.cache, **options)
+            except Exception:
+                with self._stats_lock:
+                    self.scans_failed += 1
+                raise
+
+            with self._stats_lock:
+                self.scans_served += 1
+                for stage, seconds in summary['timings'].items():
+                    self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+        return summary
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                'uptime': round(time.time() - self.started, 3),
+                'scans_served': self.scans_served,
+                'scans_failed': self.scans_failed,
+                'cache_hits': self.cache.hits,
+                'cache_misses': self.cache.misses,
+                'stage_seconds': {stage: round(seconds, 6) for stage, seconds in self.stage_seconds.items()}
+            }
+
+
+def _check_options(options: Dict):
+    if not isinstance(options, dict):
+        raise ValueError("'options' must be a JSON object")
+
+    unknown = set(options) - set(SCAN_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(sorted(unknown))}")
+
+    for name, value in options.items():
+        expected = SCAN_OPTIONS[name]
+        if value is None and name in ('max_depth', 'since', 'previous_path'):
+            continue
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise ValueError(f"Option '{name}' must be of type {expected.__name__}, got {value!r}")
+
+    for name in ('include', 'exclude'):
+        if not all(isinstance(pattern, str) for pattern in options.get(name, [])):
+            raise ValueError(f"Option '{name}' must be a list of strings")
+
+    if options.get('max_depth') is not None and options['max_depth'] < 0:
+        raise ValueError("Option 'max_depth' must not be negative")
+    if options.get('jobs', 1) < 0:
+        raise ValueError("Option 'jobs' must not be negative")
+    if options.get('prefer', 'lock') not in PREFER_CHOICES:
+        raise ValueError(f"Option 'prefer' must be one of {', '.join(PREFER_CHOICES)}")
+
+    since = options.get('since')
+    previous_path = options.get('previous_path')
+    if bool(since) != bool(previous_path):
+        raise ValueError("Options 'since' and 'previous_path' must be used together")
+    if previous_path and not os.path.isfile(previous_path):
+        raise ValueError(f"Option 'previous_path' must be an existing file, got {previous_path!r}")
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+
+    service: ScanService = None
+    token: str = None
+    check_host = False
+
+    def _send(self, status: int, payload: Dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _rejection(self) -> Optional[Tuple[int, str]]:
+        # browsers send Origin on cross-origin requests; a local client has no reason to
+        if 'Origin' in self.headers:
+            return 403, "Cross-origin requests are not allowed"
+
+        host = self.headers.get('Host', '')
+        if self.check_host and (host.rpartition(':')[0] or host) not in LOCAL_HOSTS:
+            return 403, f"Unexpected Host {host!r}"
+
+        if self.token and not hmac.compare_digest(self.headers.get('Authorization', ''), f"Bearer {self.token}"):
+            return 401, "Missing or invalid token"
+
+        return None
+
+    def do_GET(self):
+        rejection = self._rejection()
+        if rejection:
+            self._send(rejection[0], {'error': rejection[1]})
+        elif self.path == '/stats':
+            self._send(200, self.service.stats())
+        else:
+            self._send(404, {'error': f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/scan':
+            self._send(404, {'error': f"Unknown endpoint {self.path}"})
+            return
+
+        rejection = self._rejection()
+        if rejection is None and self.headers.get_content_type() != 'application/json':
+            rejection = 415, "Content-Type must be application/json"
+        if rejection:
+            self._send(rejection[0], {'error': rejection[1]})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            summary = self.service.scan(request)
+        except ValueError as e:
+            self._send(400, {'error': str(e)})
+        except Exception as e:
+            logs.error(f"Scan failed: {e}")
+            self._send(500, {'error': f"{e.__class__.__name__}: {e}"})
+        else:
+            self._send(200, summary)
+
+    def address_string(self) -> str:
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        logs.debug(f"{self.address_string()} {format % args}")
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('unix', 0)
+
+
+def _stop(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _is_socket(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except OSError:
+        return False
+
+
+def serve(socket_path: str = None, port: int = 0, cache_dir: str = None, cache_size: int = DEFAULT_MAX_SIZE,
+          memory_entries: int = DEFAULT_MEMORY_ENTRIES, token: str = None):
+    cache = ParseCache(cache_dir, cache_size, memory_entries=memory_entries)
+
+    # the socket file's permissions guard the unix transport; any local process can reach the TCP port
+    if not socket_path and not token:
+        token = secrets.token_urlsafe(32)
+        logs.info(f"Generated token, send it as 'Authorization: Bearer {token}'")
+
+    handler = type('BoundScanRequestHandler', (ScanRequestHandler,), {
+        'service': ScanService(cache), 'token': token, 'check_host': not socket_path})
+
+    if socket_path:
+        if os.path.lexists(socket_path):
+            if not _is_socket(socket_path):
+                raise FileExistsError(f"{socket_path} already exists and is not a socket, refusing to replace it")
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, handler)
+        logs.info(f"Listening on unix socket {socket_path}")
+    else:
+        server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        logs.info(f"Listening on http://127.0.0.1:{server.server_address[1]}")
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and _is_socket(socket_path):
+            os.remove(socket_path)
@@ -0,0 +1,91 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+from helpers.parse_cache import ParseCache
+from helpers.profiler import active_profiler, span
+from parsers.base_parser import Parser
+
+MIN_PARALLEL_FILES = 16
+
+_worker_parsers = {}
+
+
+def _parse_file(item: Tuple[type, str, str]) -> List[Tuple[str, str, str]]:
+    parser_cls, repo_path, file_path = item
+
+    parser = _worker_parsers.get((parser_cls, repo_path))
+    if parser is None:
+        parser = _worker_parsers[(parser_cls, repo_path)] = parser_cls(repo_path)
+
+    return parser.parse_dependencies(file_path)
+
+
+def _parse_file_timed(item: Tuple[type, str, str]) -> Tuple[List[Tuple[str, str, str]], float, float, int]:
+    start = time.perf_counter()
+    dependencies = _parse_file(item)
+    return dependencies, start, time.perf_counter(), os.getpid()
+
+
+def resolve_jobs(jobs: int) -> int:
+    if jobs is None or jobs < 1:
+        return os.cpu_count() or 1
+
+    return jobs
+
+
+def parse_files(work_items: List[Tuple[Parser, str]], jobs: int = 1,
+                cache: ParseCache = None) -> List[List[Tuple[str, str, str]]]:
+    results = [None] * len(work_items)
+    keys = [None] * len(work_items)
+    pending = []
+
+    with span('cache lookup', 'cache'):
+        for index, (parser, file_path) in enumerate(work_items):
+            if cache is not None:
+                keys[index] = cache.key(parser, file_path)
+                if keys[index] is not None:
+                    results[index] = cache.get(keys[index])
+            if results[index] is None:
+                pending.append(index)
+
+    for index, dependencies in zip(pending, _run([work_items[index] for index in pending], jobs)):
+        results[index] = dependencies
+        if cache is not None and keys[index] is not None:
+            cache.put(keys[index], dependencies)
+
+    if cache is not None:
+        cache.prune()
+
+    return results
+
+
+def _run(work_items: List[Tuple[Parser, str]], jobs: int) -> List[List[Tuple[str, str, str]]]:
+    jobs = resolve_jobs(jobs)
+    profiler = active_profiler()
+
+    if jobs == 1 or len(work_items) < MIN_PARALLEL_FILES:
+        if profiler is None:
+            return [parser.parse_dependencies(file_path) for parser, file_path in work_items]
+
+        results = []
+        for parser, file_path in work_items:
+            start = time.perf_counter()
+            results.append(parser.parse_dependencies(file_path))
+            profiler.record_file(parser.__class__.__name__, file_path, start, time.perf_counter())
+        return results
+
+    items = [(parser.__class__, parser.repo_path, file_path) for parser, file_path in work_items]
+    chunksize = max(1, len(items) // (jobs * 4))
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+        if profiler is None:
+            return list(executor.map(_parse_file, items, chunksize=chunksize))
+
+        results = []
+        for (parser_cls, _, file_path), (dependencies, start, end, pid) in \
+                zip(items, executor.map(_parse_file_timed, items, chunksize=chunksize)):
+            results.append(dependencies)
+            profiler.record_file(parser_cls.__name__, file_path, start, end, pid)
+        return results
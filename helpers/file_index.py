@@ -0,0 +1,63 @@
+import os
+from typing import Dict, Iterable, List
+
+from consts.dependency_files import DEPENDENCY_FILES
+from helpers.census import file_extension
+from helpers.walker import RepositoryWalker
+
+
+class FileIndex:
+
+    def __init__(self, repo_path: str, dependency_files: Dict[str, List[str]] = None,
+                 walker: RepositoryWalker = None):
+        self.repo_path = repo_path
+        self.walker = walker or RepositoryWalker(repo_path)
+        self.extension_counts = {}
+        self._files = {}
+        self._order = {}
+        self._names = set()
+        self._suffixes = {}
+        self._suffix_tuple = ()
+
+        for names in (dependency_files or DEPENDENCY_FILES).values():
+            for name in names:
+                if name.startswith('*'):
+                    self._suffixes[name[1:]] = name
+                else:
+                    self._names.add(name)
+        self._suffix_tuple = tuple(self._suffixes)
+
+    def build(self) -> 'FileIndex':
+        self.extension_counts = {}
+        self._files = {}
+        self._order = {}
+
+        for root, files in self.walker.walk():
+            for file in files:
+                self.add(os.path.join(root, file), file)
+
+        return self
+
+    def add(self, path: str, file: str = None):
+        file = file or os.path.basename(path)
+        file_ext = file_extension(file)
+        self.extension_counts[file_ext] = self.extension_counts.get(file_ext, 0) + 1
+
+        if file in self._names:
+            self._add(file, path)
+
+        if file.endswith(self._suffix_tuple):
+            for suffix, pattern in self._suffixes.items():
+                if file.endswith(suffix) and file != suffix:
+                    self._add(pattern, path)
+
+    def _add(self, key: str, path: str):
+        self._files.setdefault(key, []).append(path)
+        self._order.setdefault(path, len(self._order))
+
+    def find(self, names: Iterable[str]) -> List[str]:
+        paths = set()
+        for name in names:
+            paths.update(self._files.get(name, []))
+
+        return sorted(paths, key=self._order.__getitem__)
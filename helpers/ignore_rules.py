@@ -0,0 +1,123 @@
+import re
+from typing import List, Optional
+
+
+def _translate(pattern: str) -> str:
+    i, n = 0, len(pattern)
+    res = []
+
+    while i < n:
+        c = pattern[i]
+
+        if c == '*':
+            if pattern.startswith('**/', i):
+                res.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                res.append('.*')
+                i += 2
+                continue
+            res.append('[^/]*')
+        elif c == '?':
+            res.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                res.append(re.escape(c))
+            else:
+                chars = pattern[i + 1:end].replace('\\', '\\\\')
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+                res.append(f'[{chars}]')
+                i = end + 1
+                continue
+        elif c == '\\' and i + 1 < n:
+            res.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            res.append(re.escape(c))
+
+        i += 1
+
+    return ''.join(res)
+
+
+class IgnoreRule:
+
+    def __init__(self, pattern: str, base: str = ''):
+        self.negated = pattern.startswith('!')
+        if self.negated:
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        self.anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+
+        self.base = base
+        self.pattern = pattern
+        self._regex = re.compile(('' if self.anchored else '(?:.*/)?') + _translate(pattern) + '$')
+
+        literal = []
+        for part in pattern.split('/'):
+            if any(c in part for c in '*?[\\'):
+                break
+            literal.append(part)
+        self._literal_prefix = literal
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+
+        if self.base:
+            if not rel_path.startswith(self.base + '/'):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+
+        return self._regex.match(rel_path) is not None
+
+    def could_contain(self, rel_dir: str) -> bool:
+        if not self.anchored:
+            return True
+
+        parts = rel_dir.split('/') if rel_dir else []
+        prefix = self._literal_prefix
+        size = min(len(parts), len(prefix))
+
+        return parts[:size] == prefix[:size]
+
+
+def parse_rules(lines: List[str], base: str = '') -> List[IgnoreRule]:
+    rules = []
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.endswith(' ') and not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            continue
+
+        rules.append(IgnoreRule(line, base))
+
+    return rules
+
+
+def load_rules(file_path: str, base: str = '') -> List[IgnoreRule]:
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+            return parse_rules(file.readlines(), base)
+    except OSError:
+        return []
+
+
+def is_ignored(rules: List[IgnoreRule], rel_path: str, is_dir: bool) -> Optional[bool]:
+    ignored = None
+
+    for rule in rules:
+        if rule.matches(rel_path, is_dir):
+            ignored = not rule.negated
+
+    return ignored
@@ -0,0 +1,69 @@
+import json
+import subprocess
+from typing import Dict, Iterable, List, Tuple
+
+from consts.file_extensions import LANGUAGE_EXTENSIONS
+from consts.ignored_dirs import IGNORE_FILES
+from helpers.cyclonedx_converter import SOURCE_PROPERTY
+
+LANGUAGE_PROPERTY_PREFIX = "files.language."
+
+
+def _git(repo_path: str, *args: str) -> List[str]:
+    try:
+        result = subprocess.run(['git', '-C', repo_path, *args], capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise ValueError(e.stderr.strip() or f"git {args[0]} failed")
+
+    return result.stdout.split('\0')
+
+
+def git_changed_files(repo_path: str, since: str) -> Dict[str, str]:
+    changes = {}
+
+    entries = _git(repo_path, 'diff', '--name-status', '--no-renames', '--relative', '-z', since, '--')
+    for status, path in zip(entries[0::2], entries[1::2]):
+        changes[path] = 'D' if status.startswith('D') else 'A' if status.startswith('A') else 'M'
+
+    for path in _git(repo_path, 'ls-files', '--others', '--exclude-standard', '-z'):
+        if path:
+            changes[path] = 'A'
+
+    # ignore rules decide which unchanged files are scanned at all, so the previous report no longer applies
+    for path in changes:
+        if path.rpartition('/')[2] in IGNORE_FILES:
+            raise ValueError(f"{path} changed since {since}")
+
+    return changes
+
+
+def load_previous_report(report_path: str, known_languages: Iterable[str] = None) -> Dict:
+    with open(report_path, 'r') as file:
+        bom = json.load(file)
+
+    language_names = {language.lower(): language for language in (known_languages or LANGUAGE_EXTENSIONS)}
+    languages = {}
+    files: Dict[str, List[Tuple[str, str, str]]] = {}
+
+    for component in bom.get('components', []):
+        properties = component.get('properties', [])
+
+        if component.get('bom-ref') == 'project':
+            for prop in properties:
+                language = language_names.get(prop['name'][len(LANGUAGE_PROPERTY_PREFIX):])
+                if prop['name'].startswith(LANGUAGE_PROPERTY_PREFIX) and language:
+                    languages[language] = int(prop['value'])
+            continue
+
+        language = next((prop['value'] for prop in properties if prop['name'] == 'language'), None)
+        sources = [prop['value'] for prop in properties if prop['name'] == SOURCE_PROPERTY]
+        if not sources:
+            raise ValueError(f"{report_path} has no {SOURCE_PROPERTY} for {component.get('bom-ref')}")
+
+        for source in sources:
+            files.setdefault(source, []).append((language, component.get('name'), component.get('version')))
+
+    return {
+        'languages': languages,
+        'files': files
+    }
@@ -0,0 +1,150 @@
+import json
+import re
+from typing import Any, Iterator, TextIO, Tuple
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SKIP = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+
+
+class JsonStreamError(ValueError):
+    pass
+
+
+# Values behind yielded keys/indexes are skipped unless read; nested iterators must be exhausted.
+class JsonStream:
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._pending = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = None) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        found = self._peek()
+        if found != char:
+            raise JsonStreamError(f"Expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        self._pending = False
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill(max(self._chunk_size, len(self._buffer))):
+                    raise JsonStreamError(str(e))
+                continue
+
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if is_number and _NUMBER_TAIL.fullmatch(self._buffer, end) and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        self._pending = False
+        if self._peek() not in ('{', '['):
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            self._pos = _SKIP.match(self._buffer, self._pos).end()
+            if self._pos == len(self._buffer) or self._buffer[self._pos] == '"':
+                if not self._fill(max(self._chunk_size, len(self._buffer) - self._pos)):
+                    raise JsonStreamError("Unexpected end of file")
+                continue
+
+            if self._buffer[self._pos] in '{[':
+                depth += 1
+            else:
+                depth -= 1
+            self._pos += 1
+
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        self._pending = False
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            if self._peek() != '"':
+                raise JsonStreamError("Expected an object key")
+            key = self.read_value()
+            self._expect(':')
+
+            self._pending = True
+            yield key
+            if self._pending:
+                self.skip_value()
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise JsonStreamError(f"Expected ',' or '}}', found {separator or 'end of file'!r}")
+
+    def iter_array(self) -> Iterator[int]:
+        self._pending = False
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        index = 0
+        while True:
+            self._pending = True
+            yield index
+            if self._pending:
+                self.skip_value()
+
+            separator = self._peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise JsonStreamError(f"Expected ',' or ']', found {separator or 'end of file'!r}")
+            index += 1
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        for key in self.iter_object():
+            yield key, self.read_value()
+
+    def iter_values(self) -> Iterator[Any]:
+        for _ in self.iter_array():
+            yield self.read_value()
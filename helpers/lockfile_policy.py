@@ -0,0 +1,76 @@
+import fnmatch
+import os
+from typing import Iterable, List
+
+from consts.dependency_files import LOCK_FILES, MODULE_GRAPH_FILES, SHARED_INPUTS
+
+PREFER_CHOICES = ('lock', 'manifest', 'both')
+
+MANIFEST_FILES = {}
+for _manifest, _locks in LOCK_FILES.items():
+    for _lock in _locks:
+        _lock_dir, _, _lock_name = _lock.rpartition('/')
+        _up = '../' * (_lock_dir.count('/') + 1) if _lock_dir else ''
+        MANIFEST_FILES.setdefault(_lock_name, []).append(_up + _manifest)
+
+
+def _lookup(table, name: str) -> List[str]:
+    found = list(table.get(name, []))
+    for pattern, others in table.items():
+        if '*' in pattern and fnmatch.fnmatchcase(name, pattern):
+            found.extend(others)
+
+    return found
+
+
+def _present(names_by_directory, directory: str, other: str) -> bool:
+    other_dir, _, other_name = other.rpartition('/')
+    if other_dir:
+        directory = os.path.normpath(os.path.join(directory, *other_dir.split('/')))
+
+    names = names_by_directory.get(directory, ())
+    if '*' in other_name:
+        return any(fnmatch.fnmatchcase(name, other_name) for name in names)
+
+    return other_name in names
+
+
+def related_files(name: str) -> List[str]:
+    related = _lookup(LOCK_FILES, name)
+    for manifest in _lookup(MANIFEST_FILES, name):
+        related.append(manifest)
+        manifest_dir, _, manifest_name = manifest.rpartition('/')
+        related.extend(f"{manifest_dir}/{lock}" if manifest_dir else lock
+                       for lock in _lookup(LOCK_FILES, manifest_name) if lock != name)
+
+    return list(dict.fromkeys(related))
+
+
+def shared_input_dependents(name: str) -> List[str]:
+    return [dependent for pattern, dependents in SHARED_INPUTS.items() if fnmatch.fnmatchcase(name, pattern)
+            for dependent in dependents]
+
+
+def without_module_graph(file_paths: Iterable[str]) -> List[str]:
+    return [file_path for file_path in file_paths if os.path.basename(file_path) not in MODULE_GRAPH_FILES]
+
+
+def apply_preference(file_paths: Iterable[str], prefer: str = 'lock') -> List[str]:
+    file_paths = list(file_paths)
+    if prefer == 'both':
+        return file_paths
+
+    counterparts = LOCK_FILES if prefer == 'lock' else MANIFEST_FILES
+    names_by_directory = {}
+    for file_path in file_paths:
+        directory, name = os.path.split(file_path)
+        names_by_directory.setdefault(directory, set()).add(name)
+
+    selected = []
+    for file_path in file_paths:
+        directory, name = os.path.split(file_path)
+        if any(_present(names_by_directory, directory, other) for other in _lookup(counterparts, name)):
+            continue
+        selected.append(file_path)
+
+    return selected
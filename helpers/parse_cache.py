@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from consts.cache import DEFAULT_MAX_SIZE, HASH_CHUNK_SIZE
+from helpers.log import logs
+from metadata import __version__
+
+
+class ParseCache:
+
+    def __init__(self, cache_dir: Optional[str], max_size: int = DEFAULT_MAX_SIZE, memory_entries: int = 0):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._written = 0
+        self._memory = OrderedDict()
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, parser, file_path: str) -> Optional[str]:
+        try:
+            fingerprints = [_fingerprint(file_path)]
+        except OSError:
+            return None
+
+        for input_path in parser.dependency_inputs(file_path):
+            try:
+                fingerprints.append(_fingerprint(input_path))
+            except OSError:
+                fingerprints.append(f"{os.path.abspath(input_path)}:missing")
+
+        parser_version = f"{__version__}:{parser.__class__.__name__}:{parser.version}"
+        raw_key = "\0".join([parser_version] + fingerprints)
+
+        return hashlib.blake2b(raw_key.encode('utf-8'), digest_size=20).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, dependencies: List[Tuple[str, str, str]]):
+        if not self.memory_entries:
+            return
+
+        self._memory[key] = dependencies
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[List[Tuple[str, str, str]]]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return list(self._memory[key])
+
+        if not self.cache_dir:
+            self.misses += 1
+            return None
+
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, 'r') as file:
+                data = json.load(file)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        dependencies = [tuple(dependency) for dependency in data['dependencies']]
+        self._remember(key, dependencies)
+        return list(dependencies)
+
+    def put(self, key: str, dependencies: List[Tuple[str, str, str]]):
+        self._remember(key, list(dependencies))
+        if not self.cache_dir:
+            return
+
+        entry_path = self._entry_path(key)
+
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as file:
+                json.dump({'dependencies': dependencies}, file, separators=(',', ':'))
+            os.replace(tmp_path, entry_path)
+            self._written += os.path.getsize(entry_path)
+        except OSError as e:
+            logs.warning(f"Could not write parse cache entry {entry_path}: {e}")
+
+    def prune(self):
+        if not self.cache_dir or not self._written:
+            return
+
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                continue
+
+        self._written = 0
+
+
+def _fingerprint(file_path: str) -> str:
+    stat = os.stat(file_path)
+    content_hash = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            content_hash.update(chunk)
+
+    return ":".join([os.path.abspath(file_path), str(stat.st_size), str(stat.st_mtime_ns), content_hash.hexdigest()])
@@ -0,0 +1,147 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+TOP_FILES = 10
+
+
+class Profiler:
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.events = []
+        self.peak_memory = None
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def start(self):
+        self._origin = time.perf_counter()
+        if self.trace_memory:
+            tracemalloc.start()
+
+    def stop(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def record(self, name: str, category: str, start: float, end: float, pid: int = None, args: Dict = None):
+        self.events.append((name, category, start, end, pid or self._pid, threading.get_ident(), args or {}))
+
+    def record_file(self, parser_name: str, file_path: str, start: float, end: float, pid: int = None):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+
+        self.record(os.path.basename(file_path), 'parse', start, end, pid,
+                    {'parser': parser_name, 'file': file_path, 'bytes': size})
+
+    def summary(self, top: int = TOP_FILES) -> Dict:
+        stages = {}
+        parsers = {}
+        files = []
+        bytes_read = 0
+
+        for name, category, start, end, _, _, args in self.events:
+            duration = end - start
+            if category == 'stage':
+                stages[name] = stages.get(name, 0.0) + duration
+            elif category == 'find':
+                parsers[name] = parsers.get(name, 0.0) + duration
+            elif category == 'parse':
+                parsers[args['parser']] = parsers.get(args['parser'], 0.0) + duration
+                files.append((duration, args['file']))
+                bytes_read += args['bytes']
+
+        files.sort(reverse=True)
+
+        return {
+            'stages': stages,
+            'parsers': parsers,
+            'slowest_files': [{'file': file, 'seconds': seconds} for seconds, file in files[:top]],
+            'files_parsed': len(files),
+            'bytes_read': bytes_read,
+            'peak_memory': self.peak_memory
+        }
+
+    def trace_events(self) -> List[Dict]:
+        return [{
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self._origin) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+            'pid': pid,
+            'tid': tid,
+            'args': args
+        } for name, category, start, end, pid, tid, args in self.events]
+
+    def write_trace(self, path: str):
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, file)
+
+
+class Span:
+
+    def __init__(self, profiler: Profiler, name: str, category: str, args: Dict):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter(), args=self.args)
+
+
+class NullSpan:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+_NULL_SPAN = NullSpan()
+_profiler = None
+
+
+def active_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def activate(profiler: Optional[Profiler]):
+    global _profiler
+    _profiler = profiler
+
+
+def span(name: str, category: str = 'stage', **args):
+    if _profiler is None:
+        return _NULL_SPAN
+
+    return Span(_profiler, name, category, args)
+
+
+def format_summary(summary: Dict) -> List[str]:
+    lines = ["Stages:"]
+    lines += [f"  {name:<30} {seconds:>9.3f}s" for name, seconds in summary['stages'].items()]
+
+    lines.append("Parsers:")
+    lines += [f"  {name:<30} {seconds:>9.3f}s"
+              for name, seconds in sorted(summary['parsers'].items(), key=lambda item: -item[1])]
+
+    lines.append(f"Slowest files ({summary['files_parsed']} parsed, {summary['bytes_read'] / 1024 / 1024:.1f} MB read):")
+    lines += [f"  {entry['seconds']:>9.3f}s  {entry['file']}" for entry in summary['slowest_files']]
+
+    if summary['peak_memory'] is not None:
+        lines.append(f"Peak memory: {summary['peak_memory'] / 1024 / 1024:.1f} MB")
+
+    return lines
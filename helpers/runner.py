@@ -0,0 +1,65 @@
+import time
+from typing import Dict, Iterable
+
+from helpers.cyclonedx_converter import save_cyclonedx
+from helpers.incremental import git_changed_files, load_previous_report
+from helpers.log import logs
+from helpers.parse_cache import ParseCache
+from helpers.profiler import span
+from helpers.scanner import RepositoryScanner
+
+
+def run_scan(repo_path: str, output_path: str, include: Iterable[str] = (), exclude: Iterable[str] = (),
+             max_depth: int = None, jobs: int = 1, cache: ParseCache = None, prefer: str = 'lock',
+             compact: bool = False, since: str = None, previous_path: str = None,
+             module_graph: bool = False) -> Dict:
+    scanner = RepositoryScanner(repo_path, include=include, exclude=exclude, max_depth=max_depth,
+                                jobs=jobs, cache=cache, prefer=prefer, module_graph=module_graph)
+
+    if since:
+        try:
+            with span('changes'):
+                changes = git_changed_files(repo_path, since)
+                previous = load_previous_report(previous_path, scanner.registry.languages())
+        except (OSError, ValueError) as e:
+            logs.warning(f"Incremental scan not possible, running a full scan: {e}")
+            since = None
+
+    timings = {}
+
+    if since:
+        logs.info(f"Patching {previous_path} with {len(changes)} files changed since {since}...")
+        start = time.perf_counter()
+        with span('dependencies'):
+            scanner.scan_changes(changes, previous)
+        timings['dependencies'] = time.perf_counter() - start
+    else:
+        logs.info("Determining languages...")
+        start = time.perf_counter()
+        with span('languages'):
+            languages = scanner.scan_languages()
+        timings['languages'] = time.perf_counter() - start
+        logs.info(f"Found languages: {languages}")
+
+        logs.info("Scanning dependencies...")
+        start = time.perf_counter()
+        with span('dependencies'):
+            scanner.scan_dependencies()
+        timings['dependencies'] = time.perf_counter() - start
+
+    if cache:
+        logs.info(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
+
+    results = scanner.get_results()
+
+    logs.info("Convert to cyclonedx...")
+    start = time.perf_counter()
+    with span('export'):
+        save_cyclonedx(results, repo_path, output_path, compact=compact)
+    timings['export'] = time.perf_counter() - start
+
+    return {
+        'languages': results['languages'],
+        'components': len(results['components']),
+        'timings': timings
+    }
@@ -1,73 +1,166 @@
+import fnmatch
 import os
-from typing import Dict, List, Tuple
+import posixpath
+from typing import Dict, Iterable, List, Tuple
 
-from consts.file_extensions import LANGUAGE_EXTENSIONS
-from parsers import *
+from helpers.census import file_extension, languages_from_extensions
+from helpers.component_index import ComponentIndex
+from helpers.executor import parse_files
+from helpers.file_index import FileIndex
+from helpers.lockfile_policy import apply_preference, related_files, shared_input_dependents, without_module_graph
+from helpers.parse_cache import ParseCache
+from helpers.profiler import span
+from helpers.walker import RepositoryWalker
+from parsers.registry import ParserRegistry, default_registry
 
 
 class RepositoryScanner:
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                 max_depth: int = None, jobs: int = 1, cache: ParseCache = None, prefer: str = 'lock',
+                 registry: ParserRegistry = None, module_graph: bool = False):
         self.repo_path = repo_path
+        self.prefer = prefer
+        self.module_graph = module_graph
+        self.jobs = jobs
+        self.cache = cache
+        self.registry = registry or default_registry
+        self.walker = RepositoryWalker(repo_path, include=include, exclude=exclude, max_depth=max_depth)
         self._language_counters = {}
         self._dependencies = []
+        self._file_dependencies = {}
+        self._components = ComponentIndex()
+        self._edges = []
+        self._file_index = None
+        self._extension_languages = self.registry.extension_languages()
 
-    def scan_languages(self) -> Dict[str, int]:
-        self._language_counters = {}
-
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                file_ext = os.path.splitext(file)[1].lower()
+    def _new_file_index(self) -> FileIndex:
+        return FileIndex(self.repo_path, dependency_files=self.registry.dependency_files(), walker=self.walker)
 
-                for language, extensions in LANGUAGE_EXTENSIONS.items():
-                    if file_ext in extensions:
-                        self._language_counters[language] = self._language_counters.get(language, 0) + 1
-                        break
+    def scan_languages(self) -> Dict[str, int]:
+        self._file_index = self._new_file_index().build()
+        self._language_counters = languages_from_extensions(self._file_index.extension_counts,
+                                                            self._extension_languages)
 
         return self._language_counters
 
     def get_language_parsers(self):
         parsers = {}
+        detectable = set(self._extension_languages.values())
+
+        for language in self.registry.languages():
+            # Plugin languages without declared extensions cannot be detected, so they always run
+            if language not in self._language_counters and language in detectable:
+                continue
 
-        if 'Python' in self._language_counters:
-            parsers['Python'] = PythonParser(self.repo_path)
+            parser_cls = self.registry.get(language)
+            if parser_cls is not None:
+                parsers[language] = parser_cls(self.repo_path, self._file_index)
 
-        if 'JavaScript' in self._language_counters:
-            parsers['JavaScript'] = JavaScriptParser(self.repo_path)
+        return parsers
+
+    def scan_dependencies(self) -> List[Tuple[str, str, str]]:
+        if not self._language_counters:
+            self.scan_languages()
 
-        if 'Java' in self._language_counters:
-            parsers['Java'] = JavaParser(self.repo_path)
+        return self._parse(self.get_language_parsers(), {})
+
+    def scan_changes(self, changes: Dict[str, str], previous: Dict) -> List[Tuple[str, str, str]]:
+        self._language_counters = dict(previous['languages'])
+        self._file_index = self._new_file_index()
+        file_dependencies = dict(previous['files'])
+
+        changes = dict(changes)
+        full_index = None
+        for rel_path in list(changes):
+            directory, _, name = rel_path.rpartition('/')
+            for sibling in related_files(name):
+                for sibling_path in self._expand(posixpath.normpath(f"{directory}/{sibling}" if directory else sibling)):
+                    if sibling_path not in changes and os.path.isfile(os.path.join(self.repo_path, sibling_path)):
+                        changes[sibling_path] = 'M'
+
+            # dependents without components are missing from the previous report, so they are looked up on disk
+            dependents = shared_input_dependents(name)
+            if dependents:
+                full_index = full_index or self._new_file_index().build()
+                for file_path in full_index.find(dependents):
+                    path = os.path.relpath(file_path, self.repo_path).replace(os.sep, '/')
+                    changes.setdefault(path, 'M')
+
+        for rel_path, status in changes.items():
+            file_dependencies.pop(rel_path, None)
+            if not self.walker.accepts(rel_path):
+                continue
+
+            language = self._extension_languages.get(file_extension(rel_path.rsplit('/', 1)[-1]))
+            if language and status in ('A', 'D'):
+                count = self._language_counters.get(language, 0) + (1 if status == 'A' else -1)
+                if count > 0:
+                    self._language_counters[language] = count
+                else:
+                    self._language_counters.pop(language, None)
+
+            if status != 'D':
+                self._file_index.add(os.path.join(self.repo_path, *rel_path.split('/')))
+
+        # a language seen for the first time enables a parser whose unchanged files were never parsed
+        if set(self._language_counters) - set(previous['languages']):
+            self._language_counters = {}
+            return self.scan_dependencies()
 
-        if 'C++' in self._language_counters:
-            parsers['C++'] = CppParser(self.repo_path)
+        parsers = self.get_language_parsers()
+        file_dependencies = {path: dependencies for path, dependencies in file_dependencies.items()
+                             if all(dependency[0] in parsers for dependency in dependencies)}
 
-        if 'C#' in self._language_counters:
-            parsers['C#'] = CSharpParser(self.repo_path)
+        return self._parse(parsers, file_dependencies)
 
-        if 'Go' in self._language_counters:
-            parsers['Go'] = GoParser(self.repo_path)
+    def _expand(self, rel_path: str) -> List[str]:
+        if rel_path.startswith('../'):
+            return []
+        if '*' not in rel_path:
+            return [rel_path]
 
-        if 'Rust' in self._language_counters:
-            parsers['Rust'] = RustParser(self.repo_path)
+        directory, _, pattern = rel_path.rpartition('/')
+        try:
+            names = os.listdir(os.path.join(self.repo_path, directory))
+        except OSError:
+            return []
 
-        if 'PHP' in self._language_counters:
-            parsers['PHP'] = PhpParser(self.repo_path)
+        return [f"{directory}/{name}" if directory else name for name in fnmatch.filter(names, pattern)]
 
-        if 'Ruby' in self._language_counters:
-            parsers['Ruby'] = RubyParser(self.repo_path)
+    def find_files(self, parser) -> List[str]:
+        file_paths = parser.find_dependency_files()
+        if not self.module_graph:
+            file_paths = without_module_graph(file_paths)
 
-        return parsers
+        return apply_preference(file_paths, self.prefer)
 
-    def scan_dependencies(self) -> List[Tuple[str, str, str]]:
-        if not self._language_counters:
-            self.scan_languages()
+    def _parse(self, parsers: Dict, file_dependencies: Dict[str, List[Tuple[str, str, str]]]):
+        work_items = []
+        for parser in parsers.values():
+            with span(parser.__class__.__name__, 'find'):
+                file_paths = self.find_files(parser)
+            work_items.extend((parser, file_path) for file_path in file_paths)
 
-        parsers = self.get_language_parsers()
+        results = parse_files(work_items, self.jobs, self.cache)
+        for (_, file_path), dependencies in zip(work_items, results):
+            rel_path = os.path.relpath(file_path, self.repo_path).replace(os.sep, '/')
+            file_dependencies.setdefault(rel_path, []).extend(dependencies)
 
+        self._file_dependencies = file_dependencies
         self._dependencies = []
-        for language, parser in parsers.items():
-            dependencies = parser.get_dependencies()
+        self._components = ComponentIndex()
+        for rel_path, dependencies in file_dependencies.items():
             self._dependencies.extend(dependencies)
+            for dependency in dependencies:
+                self._components.add(dependency, rel_path)
+
+        # edges are read for unchanged files too, since the previous report only keeps components
+        self._edges = []
+        for rel_path, dependencies in file_dependencies.items():
+            parser = parsers.get(dependencies[0][0]) if dependencies else None
+            if parser is not None:
+                self._edges.extend(parser.dependency_edges(os.path.join(self.repo_path, *rel_path.split('/'))))
 
         return self._dependencies
 
@@ -75,5 +168,9 @@ class RepositoryScanner:
 
         return {
             'languages': self._language_counters,
-            'dependencies': self._dependencies
+            'dependencies': self._dependencies,
+            'files': self._file_dependencies,
+            'components': self._components,
+            'edges': self._edges
         }
+
@@ -0,0 +1,109 @@
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+from consts.ignored_dirs import IGNORE_FILES, PRUNED_DIRECTORIES
+from helpers.ignore_rules import is_ignored, load_rules, parse_rules
+
+
+class RepositoryWalker:
+
+    def __init__(self, repo_path: str, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                 max_depth: int = None, pruned_directories: Iterable[str] = PRUNED_DIRECTORIES):
+        self.repo_path = repo_path
+        self.max_depth = max_depth
+        self.pruned_directories = set(pruned_directories)
+        self._include = parse_rules(list(include))
+        self._exclude = parse_rules(list(exclude))
+
+    def walk(self) -> Iterator[Tuple[str, List[str]]]:
+        root_path = self.repo_path.rstrip(os.sep) or os.sep
+        stack = [(root_path, '', [], not self._include)]
+
+        while stack:
+            root, rel_root, rules, dir_included = stack.pop()
+
+            dirs = []
+            files = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            files.append(entry.name)
+                        elif not entry.is_symlink():
+                            dirs.append(entry.name)
+            except OSError:
+                continue
+
+            dir_rules = self._directory_rules(rules, root, rel_root, files)
+            filtered = bool(dir_rules or self._exclude)
+
+            children = []
+            depth = rel_root.count('/') + 1 if rel_root else 0
+            if self.max_depth is None or depth < self.max_depth:
+                for name in dirs:
+                    if name in self.pruned_directories:
+                        continue
+
+                    rel_dir = f"{rel_root}/{name}" if rel_root else name
+                    if filtered and self._is_excluded(dir_rules, rel_dir, True):
+                        continue
+
+                    child_included = dir_included or bool(is_ignored(self._include, rel_dir, True))
+                    if not child_included and not any(rule.could_contain(rel_dir) for rule in self._include):
+                        continue
+
+                    children.append((os.path.join(root, name), rel_dir, dir_rules, child_included))
+            stack.extend(reversed(children))
+
+            if dir_included and not filtered:
+                yield root, files
+                continue
+
+            selected = []
+            for name in files:
+                rel_file = f"{rel_root}/{name}" if rel_root else name
+                if filtered and self._is_excluded(dir_rules, rel_file, False):
+                    continue
+                if not dir_included and not is_ignored(self._include, rel_file, False):
+                    continue
+                selected.append(name)
+
+            yield root, selected
+
+    def accepts(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        if self.max_depth is not None and len(parts) - 1 > self.max_depth:
+            return False
+
+        rules = self._directory_rules([], self.repo_path, '')
+        included = not self._include
+
+        for i, name in enumerate(parts[:-1]):
+            rel_dir = '/'.join(parts[:i + 1])
+            if name in self.pruned_directories or self._is_excluded(rules, rel_dir, True):
+                return False
+
+            included = included or bool(is_ignored(self._include, rel_dir, True))
+            rules = self._directory_rules(rules, os.path.join(self.repo_path, *parts[:i + 1]), rel_dir)
+
+        if self._is_excluded(rules, rel_path, False):
+            return False
+
+        return included or bool(is_ignored(self._include, rel_path, False))
+
+    @staticmethod
+    def _directory_rules(rules, root: str, rel_root: str, files: List[str] = None):
+        own_rules = [rule for name in IGNORE_FILES if files is None or name in files
+                     for rule in load_rules(os.path.join(root, name), rel_root)]
+
+        return rules + own_rules if own_rules else rules
+
+    def _is_excluded(self, rules, rel_path: str, is_dir: bool) -> bool:
+        if is_ignored(self._exclude, rel_path, is_dir):
+            return True
+
+        return bool(is_ignored(rules, rel_path, is_dir))
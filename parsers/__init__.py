@@ -1,10 +1,15 @@
+import importlib
+
 from .base_parser import Parser
-from .python_parser import PythonParser
-from .java_script_parser import JavaScriptParser
-from .cpp_parser import CppParser
-from .csharp_parser import CSharpParser
-from .java_parser import JavaParser
-from .go_parser import GoParser
-from .rust_parser import RustParser
-from .ruby_parcer import RubyParser
-from .php_parser import PhpParser
\ No newline at end of file
+from .registry import BUILTIN_PARSERS, ParserRegistry, default_registry
+
+_PARSER_MODULES = {entry.partition(':')[2]: entry.partition(':')[0] for entry in BUILTIN_PARSERS.values()}
+
+__all__ = ['Parser', 'ParserRegistry', 'default_registry', *_PARSER_MODULES]
+
+
+def __getattr__(name):
+    if name in _PARSER_MODULES:
+        return getattr(importlib.import_module(_PARSER_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
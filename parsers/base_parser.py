@@ -1,12 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+from consts.dependency_files import DEPENDENCY_FILES
+from helpers.file_index import FileIndex
 
 
 class Parser(ABC):
 
-    def __init__(self, repo_path: str):
+    version = '1'
+    dependency_files: Optional[List[str]] = None
+    extensions: Optional[List[str]] = None
+
+    def __init__(self, repo_path: str, file_index: FileIndex = None):
         self.repo_path = repo_path
         self.language = self.__class__.__name__.replace('Parser', '')
+        self._file_index = file_index
+
+    @property
+    def file_index(self) -> FileIndex:
+        if self._file_index is None:
+            dependency_files = {**DEPENDENCY_FILES, self.language: self.dependency_files} \
+                if self.dependency_files else None
+            self._file_index = FileIndex(self.repo_path, dependency_files).build()
+
+        return self._file_index
 
     @abstractmethod
     def find_dependency_files(self) -> List[str]:
@@ -16,6 +33,12 @@ class Parser(ABC):
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         pass
 
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        return []
+
+    def dependency_edges(self, file_path: str) -> List[Tuple[Tuple[str, str, str], Tuple[str, str, str]]]:
+        return []
+
     def get_dependencies(self) -> List[Tuple[str, str, str]]:
         dependency_files = self.find_dependency_files()
         all_dependencies = []
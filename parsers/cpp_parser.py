@@ -1,26 +1,32 @@
 import os
 import re
-import json
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
+from helpers.json_stream import JsonStream
 from helpers.log import logs
 
+_CMAKE_TOKEN = re.compile(r'''
+    (?P<comment>\#\[(?P<comment_level>=*)\[[\s\S]*?\](?P=comment_level)\]|\#[^\n]*)
+  | (?P<bracket>\[(?P<bracket_level>=*)\[[\s\S]*?\](?P=bracket_level)\])
+  | (?P<quoted>"(?:[^"\\]|\\[\s\S])*")
+  | (?P<open>\()
+  | (?P<close>\))
+  | (?P<word>(?:[^\s()#"\\]|\\[\s\S])+)
+''', re.VERBOSE)
+_CMAKE_VARIABLE = re.compile(r'\$\{(\w+)\}')
+_CMAKE_VERSION = re.compile(r'v?\d[\w.+-]*$')
+_URL_VERSION = re.compile(r'[/_-]v?(\d+(?:\.\d+)+)(?=[^/]*$)')
+CMAKE_KEYWORDS = {'NAME', 'VERSION', 'GIT_TAG', 'GIT_REPOSITORY', 'GITHUB_REPOSITORY', 'GITLAB_REPOSITORY', 'URL'}
 
-class CppParser(Parser):
-
-    def find_dependency_files(self) -> List[str]:
 
-        dependency_files = []
-        cpp_dep_files = DEPENDENCY_FILES['C++']
+class CppParser(Parser):
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in cpp_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+    version = '2'
 
-        return dependency_files
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['C++'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
 
@@ -41,24 +47,28 @@ class CppParser(Parser):
         dependencies = []
 
         try:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
                 content = file.read()
 
-            find_packages = re.finditer(r'find_package\s*\(\s*([^\s]+)(?:\s+([^\s\)]+))?', content, re.IGNORECASE)
-            for match in find_packages:
-                package = match.group(1)
-                version = match.group(2) if match.group(2) else 'latest'
-
-                if package.lower() not in ['cmake', 'packages', 'components']:
-                    dependencies.append(('C++', package, version))
-
-            external_projects = re.finditer(r'ExternalProject_Add\s*\(\s*([^\s]+)', content, re.IGNORECASE)
-            for match in external_projects:
-                package = match.group(1)
-                version_match = re.search(rf'ExternalProject_Add\s*\(\s*{re.escape(package)}.*?VERSION\s+([^\s\)]+)',
-                                          content, re.DOTALL | re.IGNORECASE)
-                version = version_match.group(1) if version_match else 'latest'
-                dependencies.append(('C++', package, version))
+            variables = {}
+            for command, args in _cmake_commands(content):
+                args = [_CMAKE_VARIABLE.sub(lambda match: variables.get(match.group(1), match.group()), arg)
+                        for arg in args]
+
+                if command == 'set' and len(args) >= 2 and args[2:3] in ([], ['CACHE'], ['PARENT_SCOPE']):
+                    variables[args[0]] = args[1]
+                elif command == 'find_package' and args:
+                    if args[0].lower() not in ['cmake', 'packages', 'components']:
+                        version = args[1].split('...', 1)[0] if len(args) > 1 else ''
+                        version = version if _CMAKE_VERSION.match(version) else 'latest'
+                        dependencies.append(('C++', args[0], version))
+                elif command in ('externalproject_add', 'fetchcontent_declare') and args:
+                    options = _cmake_options(args[1:])
+                    dependencies.append(('C++', args[0], _cmake_source_version(options)))
+                elif command in ('cpmaddpackage', 'cpmfindpackage') and args:
+                    dependency = _cpm_package(args)
+                    if dependency:
+                        dependencies.append(('C++',) + dependency)
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
@@ -99,18 +109,95 @@ class CppParser(Parser):
 
         try:
             with open(file_path, 'r') as file:
-                data = json.load(file)
-
-            if 'dependencies' in data:
-                for dep in data['dependencies']:
-                    if isinstance(dep, str):
-                        dependencies.append(('C++', dep, 'latest'))
-                    elif isinstance(dep, dict) and 'name' in dep:
-                        package = dep['name']
-                        version = dep.get('version-string', dep.get('version', 'latest'))
-                        dependencies.append(('C++', package, version))
+                stream = JsonStream(file)
+
+                for key in stream.iter_object():
+                    if key != 'dependencies':
+                        continue
+
+                    for dep in stream.iter_values():
+                        if isinstance(dep, str):
+                            dependencies.append(('C++', dep, 'latest'))
+                        elif isinstance(dep, dict) and 'name' in dep:
+                            package = dep['name']
+                            version = dep.get('version-string', dep.get('version', 'latest'))
+                            dependencies.append(('C++', package, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+
+def _cmake_commands(content: str) -> Iterator[Tuple[str, List[str]]]:
+    command = None
+    args = []
+    depth = 0
+
+    for match in _CMAKE_TOKEN.finditer(content):
+        kind = match.lastgroup
+        if kind == 'comment':
+            continue
+
+        if depth == 0:
+            if kind == 'word':
+                command = match.group()
+            elif kind == 'open' and command:
+                depth = 1
+                args = []
+            else:
+                command = None
+            continue
+
+        if kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth -= 1
+            if depth == 0:
+                yield command.lower(), args
+                command = None
+        elif kind == 'quoted':
+            args.append(match.group()[1:-1])
+        elif kind == 'bracket':
+            level = len(match.group('bracket_level')) + 2
+            args.append(match.group()[level:-level])
+        else:
+            args.append(match.group())
+
+
+def _cmake_options(args: List[str]) -> Dict[str, str]:
+    options = {}
+    for keyword, value in zip(args, args[1:]):
+        if keyword in CMAKE_KEYWORDS and keyword not in options:
+            options[keyword] = value
+
+    return options
+
+
+def _cmake_source_version(options: Dict[str, str]) -> str:
+    if 'GIT_TAG' in options:
+        return options['GIT_TAG']
+    if 'VERSION' in options:
+        return options['VERSION']
+
+    url_version = _URL_VERSION.search(options.get('URL', ''))
+    return url_version.group(1) if url_version else 'latest'
+
+
+def _cpm_package(args: List[str]) -> Optional[Tuple[str, str]]:
+    if len(args) == 1:
+        uri, _, tag = args[0].partition('#')
+        uri, _, version = uri.partition('@')
+        name = uri.rstrip('/').rsplit('/', 1)[-1].split(':')[-1]
+        if name.endswith('.git'):
+            name = name[:-4]
+        return (name, version or tag or 'latest') if name else None
+
+    options = _cmake_options(args)
+    repository = options.get('GITHUB_REPOSITORY') or options.get('GITLAB_REPOSITORY') or \
+        options.get('GIT_REPOSITORY', '')
+    name = options.get('NAME') or repository.rstrip('/').rsplit('/', 1)[-1].replace('.git', '')
+    if not name:
+        return None
+
+    return name, options.get('VERSION') or _cmake_source_version(options)
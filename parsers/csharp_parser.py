@@ -1,62 +1,145 @@
 import os
 import re
 import xml.etree.ElementTree as ET
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .base_parser import Parser
+from consts.dependency_files import DEPENDENCY_FILES
+from helpers.json_stream import JsonStream
 from helpers.log import logs
 
+MSBUILD_PROPS = ('Directory.Build.props', 'Directory.Packages.props')
+ASSETS_FILE = os.path.join('obj', 'project.assets.json')
+_MSBUILD_PROPERTY = re.compile(r'\$\(([\w.-]+)\)')
+
 class CSharpParser(Parser):
 
+    version = '2'
+
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._projects = {}
+        self._props_chains = {}
+
     def find_dependency_files(self) -> List[str]:
-        dependency_files = []
+        file_paths = self.file_index.find(DEPENDENCY_FILES['C#'])
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file.endswith('.csproj'):
-                    dependency_files.append(os.path.join(root, file))
-                elif file == 'packages.config':
-                    dependency_files.append(os.path.join(root, file))
-                elif file.endswith('.sln'):
-                    dependency_files.append(os.path.join(root, file))
+        # obj/ is usually ignored, so restore outputs are looked up next to each project
+        found = set(file_paths)
+        for file_path in list(file_paths):
+            if file_path.endswith('.csproj'):
+                assets_path = os.path.join(os.path.dirname(file_path), ASSETS_FILE)
+                if assets_path not in found and os.path.isfile(assets_path):
+                    found.add(assets_path)
+                    file_paths.append(assets_path)
 
-        return dependency_files
+        return file_paths
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
+        file_name = os.path.basename(file_path)
 
         if file_path.endswith('.csproj'):
             dependencies = self._parse_csproj(file_path)
-        elif os.path.basename(file_path) == 'packages.config':
+        elif file_name == 'packages.config':
             dependencies = self._parse_packages_config(file_path)
         elif file_path.endswith('.sln'):
             dependencies = self._parse_sln(file_path)
+        elif file_name == 'packages.lock.json':
+            dependencies = self._parse_packages_lock(file_path)
+        elif file_name == 'project.assets.json':
+            dependencies = self._parse_project_assets(file_path)
 
         return dependencies
 
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        if not file_path.endswith('.csproj'):
+            return []
+
+        try:
+            return self._props_files(file_path)
+        except (OSError, ET.ParseError):
+            return []
+
+    def _props_files(self, file_path: str) -> List[str]:
+        directory = os.path.dirname(os.path.abspath(file_path))
+        return [path for name in MSBUILD_PROPS for path in self._props_chain(directory, name)]
+
+    def _props_chain(self, directory: str, name: str) -> List[str]:
+        key = (directory, name)
+        if key in self._props_chains:
+            return self._props_chains[key]
+
+        repo_path = os.path.abspath(self.repo_path)
+        at_root = directory == repo_path or not directory.startswith(repo_path + os.sep)
+        candidate = os.path.join(directory, name)
+
+        if os.path.isfile(candidate):
+            chain = [candidate]
+            if not at_root and self._read_project(candidate)['imports_parent']:
+                chain = self._props_chain(os.path.dirname(directory), name) + chain
+        elif at_root:
+            chain = []
+        else:
+            chain = self._props_chain(os.path.dirname(directory), name)
+
+        self._props_chains[key] = chain
+        return chain
+
+    def _read_project(self, file_path: str) -> Dict:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._projects:
+            return self._projects[file_path]
+
+        project = {'properties': {}, 'versions': {}, 'references': [], 'hint_paths': [], 'imports_parent': False}
+        file_name = os.path.basename(file_path)
+
+        for element in ET.parse(file_path).getroot().iter():
+            tag = _local_name(element.tag)
+
+            if tag == 'PropertyGroup':
+                for prop in element:
+                    project['properties'][_local_name(prop.tag)] = (prop.text or '').strip()
+            elif tag == 'PackageVersion':
+                package = element.get('Include') or element.get('Update')
+                if package:
+                    project['versions'][package.lower()] = _item_value(element, 'Version')
+            elif tag in ('PackageReference', 'GlobalPackageReference'):
+                package = element.get('Include')
+                if package:
+                    version = _item_value(element, 'VersionOverride') or _item_value(element, 'Version')
+                    project['references'].append((package, version))
+            elif tag == 'HintPath':
+                if element.text:
+                    project['hint_paths'].append(element.text.strip())
+            elif tag == 'Import':
+                imported = element.get('Project', '')
+                if file_name in imported and ('GetPathOfFileAbove' in imported or '..' in imported):
+                    project['imports_parent'] = True
+
+        self._projects[file_path] = project
+        return project
+
     def _parse_csproj(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
 
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            namespace = root.tag.split('}')[0] + '}' if '}' in root.tag else ''
+            projects = [self._read_project(path) for path in self._props_files(file_path)]
+            projects.append(self._read_project(file_path))
 
-            package_refs = root.findall(f".//{namespace}PackageReference")
-            for pkg_ref in package_refs:
-                package = pkg_ref.get('Include')
-                version = pkg_ref.get('Version')
-                if not version:
-                    version_elem = pkg_ref.find(f'.//{namespace}Version')
-                    version = version_elem.text if version_elem is not None else 'latest'
+            properties = {}
+            versions = {}
+            for project in projects:
+                properties.update(project['properties'])
+                versions.update(project['versions'])
 
-                if package:
-                    dependencies.append(('C#', package, version or 'latest'))
+            for project in projects:
+                for package, version in project['references']:
+                    version = version or versions.get(package.lower())
+                    dependencies.append(('C#', package, _interpolate(version, properties) or 'latest'))
 
-            hint_paths = root.findall(f".//{namespace}Reference/{namespace}HintPath")
-            for hint_path in hint_paths:
-                path = hint_path.text
-                if path and 'packages' in path:
+            for path in projects[-1]['hint_paths']:
+                if 'packages' in path:
                     parts = path.split('\\')
                     for i, part in enumerate(parts):
                         if part == 'packages' and i + 1 < len(parts):
@@ -111,4 +194,82 @@ class CSharpParser(Parser):
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+    def _parse_packages_lock(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig') as file:
+                stream = JsonStream(file)
+                seen = set()
+
+                for key in stream.iter_object():
+                    if key != 'dependencies':
+                        continue
+                    for _ in stream.iter_object():
+                        for package, info in stream.iter_items():
+                            version = info.get('resolved', 'latest')
+                            if info.get('type') == 'Project' or (package, version) in seen:
+                                continue
+                            seen.add((package, version))
+                            dependencies.append(('C#', package, version))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+    def _parse_project_assets(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig') as file:
+                stream = JsonStream(file)
+
+                for key in stream.iter_object():
+                    if key != 'libraries':
+                        continue
+                    # Each library carries its full file list, only the type is read
+                    for library in stream.iter_object():
+                        library_type = None
+                        for field in stream.iter_object():
+                            if field == 'type':
+                                library_type = stream.read_value()
+
+                        package, _, version = library.rpartition('/')
+                        if package and library_type != 'project':
+                            dependencies.append(('C#', package, version))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+
+def _local_name(tag) -> str:
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _item_value(element, name: str) -> Optional[str]:
+    value = element.get(name)
+    if value is not None:
+        return value
+
+    for child in element:
+        if _local_name(child.tag) == name:
+            return (child.text or '').strip()
+
+    return None
+
+
+def _interpolate(value: Optional[str], properties: Dict[str, str]) -> Optional[str]:
+    for _ in range(10):
+        if not value or '$(' not in value:
+            break
+        resolved = _MSBUILD_PROPERTY.sub(lambda match: properties.get(match.group(1), match.group()), value)
+        if resolved == value:
+            break
+        value = resolved
+
+    return value
@@ -1,23 +1,37 @@
 import os
 import re
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
 from helpers.log import logs
 
+VENDOR_MODULES = os.path.join('vendor', 'modules.txt')
+WORKSPACE_FILE = 'go.work'
+
 class GoParser(Parser):
 
+    version = '2'
+
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._mod_files = {}
+        self._workspace_paths = {}
+        self._workspaces = {}
+
     def find_dependency_files(self) -> List[str]:
-        dependency_files = []
-        go_dep_files = DEPENDENCY_FILES['Go']
+        file_paths = self.file_index.find(DEPENDENCY_FILES['Go'])
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in go_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+        # vendor/ is pruned from the walk, so the vendoring manifest is looked up next to each go.mod
+        found = set(file_paths)
+        for file_path in list(file_paths):
+            if os.path.basename(file_path) == 'go.mod':
+                vendor_path = os.path.join(os.path.dirname(file_path), VENDOR_MODULES)
+                if vendor_path not in found and os.path.isfile(vendor_path):
+                    found.add(vendor_path)
+                    file_paths.append(vendor_path)
 
-        return dependency_files
+        return file_paths
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -27,37 +41,132 @@ class GoParser(Parser):
             dependencies = self._parse_go_mod(file_path)
         elif filename == "go.sum":
             dependencies = self._parse_go_sum(file_path)
+        elif filename == "modules.txt":
+            dependencies = self._parse_vendor_modules(file_path)
         elif filename in ["Gopkg.toml", "Gopkg.lock"]:
             dependencies = self._parse_gopkg(file_path)
 
         return dependencies
 
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        if os.path.basename(file_path) != 'go.mod':
+            return []
+
+        workspace_path = self._find_workspace(os.path.dirname(os.path.abspath(file_path)))
+        return [workspace_path] if workspace_path else []
+
     def _parse_go_mod(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
 
         try:
-            with open(file_path, 'r') as file:
-                content = file.read()
+            go_mod = self._read_mod_file(file_path)
+            replaces = dict(go_mod['replaces'])
+            excludes = go_mod['excludes']
+            members = set()
+
+            workspace_path = self._find_workspace(os.path.dirname(os.path.abspath(file_path)))
+            if workspace_path:
+                workspace = self._read_workspace(workspace_path)
+                replaces.update(workspace['replaces'])
+                members = workspace['modules']
+
+            for package, version in go_mod['requires']:
+                if (package, version) in excludes or package in members:
+                    continue
+
+                replacement = replaces.get((package, version)) or replaces.get((package, None))
+                if replacement:
+                    package, version = replacement
+                    if version is None:  # local directory
+                        continue
 
-            require_lines = re.finditer(r'require\s+([^\s]+)\s+([^\s]+)', content)
-            for match in require_lines:
-                package = match.group(1)
-                version = match.group(2)
                 dependencies.append(('Go', package, version))
 
-            require_block = re.search(r'require\s+\((.*?)\)', content, re.DOTALL)
-            if require_block:
-                block_content = require_block.group(1)
-                for line in block_content.strip().split('\n'):
-                    line = line.strip()
-                    if not line or line.startswith('//'):
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+    def _read_mod_file(self, file_path: str) -> Dict:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._mod_files:
+            return self._mod_files[file_path]
+
+        mod_file = {'module': None, 'requires': [], 'replaces': {}, 'excludes': set(), 'uses': []}
+
+        with open(file_path, 'r') as file:
+            for directive, args in _mod_directives(file):
+                if directive == 'module' and args:
+                    mod_file['module'] = args[0]
+                elif directive == 'require' and len(args) >= 2:
+                    mod_file['requires'].append((args[0], args[1]))
+                elif directive == 'exclude' and len(args) >= 2:
+                    mod_file['excludes'].add((args[0], args[1]))
+                elif directive == 'replace' and '=>' in args:
+                    arrow = args.index('=>')
+                    old, new = args[:arrow], args[arrow + 1:]
+                    if old and new:
+                        mod_file['replaces'][(old[0], old[1] if len(old) > 1 else None)] = \
+                            (new[0], new[1] if len(new) > 1 else None)
+                elif directive == 'use' and args:
+                    mod_file['uses'].append(args[0])
+
+        self._mod_files[file_path] = mod_file
+        return mod_file
+
+    def _find_workspace(self, directory: str) -> Optional[str]:
+        if directory in self._workspace_paths:
+            return self._workspace_paths[directory]
+
+        repo_path = os.path.abspath(self.repo_path)
+        candidate = os.path.join(directory, WORKSPACE_FILE)
+
+        if os.path.isfile(candidate):
+            workspace_path = candidate
+        elif directory == repo_path or not directory.startswith(repo_path + os.sep):
+            workspace_path = None
+        else:
+            workspace_path = self._find_workspace(os.path.dirname(directory))
+
+        self._workspace_paths[directory] = workspace_path
+        return workspace_path
+
+    def _read_workspace(self, workspace_path: str) -> Dict:
+        if workspace_path in self._workspaces:
+            return self._workspaces[workspace_path]
+
+        work_file = self._read_mod_file(workspace_path)
+        directory = os.path.dirname(workspace_path)
+        modules = set()
+
+        for use in work_file['uses']:
+            mod_path = os.path.join(directory, use, 'go.mod')
+            if os.path.isfile(mod_path):
+                module = self._read_mod_file(mod_path)['module']
+                if module:
+                    modules.add(module)
+
+        workspace = {'modules': modules, 'replaces': work_file['replaces']}
+        self._workspaces[workspace_path] = workspace
+        return workspace
+
+    def _parse_vendor_modules(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            with open(file_path, 'r') as file:
+                for line in file:
+                    # `# module version [=> replacement [version]]`, followed by its packages
+                    if not line.startswith('# '):
                         continue
 
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        package = parts[0]
-                        version = parts[1]
-                        dependencies.append(('Go', package, version))
+                    module = line[2:].split()
+                    if '=>' in module:
+                        # local directory replacements have no version and are skipped
+                        module = module[module.index('=>') + 1:]
+
+                    if len(module) >= 2:
+                        dependencies.append(('Go', module[0], module[1]))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
@@ -66,27 +175,23 @@ class GoParser(Parser):
 
     def _parse_go_sum(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
-        seen_packages = set()
+        previous = None
 
         try:
             with open(file_path, 'r') as file:
+                # go.sum is sorted, so the module and go.mod hashes of a version are adjacent
                 for line in file:
-                    line = line.strip()
-                    if not line:
-                        continue
-
                     parts = line.split()
-                    if len(parts) >= 2:
-                        package = parts[0]
-                        if package.endswith('/go.mod'):
-                            package = package[:-7]
+                    if len(parts) < 2:
+                        continue
 
-                        version = parts[1]
+                    package, version = parts[0], parts[1]
+                    if version.endswith('/go.mod'):
+                        version = version[:-7]
 
-                        package_version = (package, version)
-                        if package_version not in seen_packages:
-                            seen_packages.add(package_version)
-                            dependencies.append(('Go', package, version))
+                    if (package, version) != previous:
+                        previous = (package, version)
+                        dependencies.append(('Go', package, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
@@ -126,4 +231,23 @@ class GoParser(Parser):
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+
+def _mod_directives(lines: Iterable[str]) -> Iterator[Tuple[str, List[str]]]:
+    block = None
+
+    for line in lines:
+        tokens = [token.strip('"`') for token in line.split('//', 1)[0].split()]
+        if not tokens:
+            continue
+
+        if block:
+            if tokens == [')']:
+                block = None
+            else:
+                yield block, tokens
+        elif tokens[-1] == '(' and len(tokens) == 2:
+            block = tokens[0]
+        else:
+            yield tokens[0], tokens[1:]
@@ -1,26 +1,43 @@
 import os
 import re
 import xml.etree.ElementTree as ET
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import toml
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
 from helpers.log import logs
 
+GRADLE_SETTINGS = ('settings.gradle', 'settings.gradle.kts')
+CATALOG_SUFFIX = '.versions.toml'
+
+_GRADLE_TOKEN = re.compile(r'''
+    (?P<comment>//[^\n]*|/\*[\s\S]*?\*/)
+  | (?P<string>"{3}[\s\S]*?"{3}|'{3}[\s\S]*?'{3}|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<name>[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)
+  | (?P<end>[\n;])
+  | (?P<punct>[{}()\[\],:=])
+''', re.VERBOSE)
+_GRADLE_VARIABLE = re.compile(r'\$\{?([\w.]+)\}?')
+_GRADLE_DECLARATIONS = ('def', 'val', 'var', 'String')
+_POM_PROPERTY = re.compile(r'\$\{([^}]+)\}')
+POM_DEPENDENCY_SECTIONS = {(), ('profiles', 'profile'), ('build', 'plugins', 'plugin')}
+
+
 class JavaParser(Parser):
 
-    def find_dependency_files(self) -> List[str]:
-        dependency_files = []
-        java_dep_files = DEPENDENCY_FILES['Java']
+    version = '3'
 
-        for root, dirs, files in os.walk(self.repo_path):
-            for file in files:
-                if file in java_dep_files or (file.endswith('.gradle') and file != '.gradle'):
-                    dependency_files.append(os.path.join(root, file))
-            if '.gradle' in java_dep_files and '.gradle' in dirs:
-                dependency_files.append(os.path.join(root, '.gradle'))
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._catalog_paths = {}
+        self._catalogs = {}
+        self._poms = {}
+        self._effective = {}
 
-        return dependency_files
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['Java'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -28,88 +45,363 @@ class JavaParser(Parser):
 
         if filename == "pom.xml":
             dependencies = self._parse_pom_xml(file_path)
-        elif filename.endswith('.gradle') or filename == '.gradle':
+        elif filename == 'gradle.lockfile':
+            dependencies = self._parse_gradle_lockfile(file_path)
+        elif filename.endswith(('.gradle', '.gradle.kts')):
             dependencies = self._parse_gradle_file(file_path)
 
         return dependencies
 
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        if file_path.endswith(('.gradle', '.gradle.kts')):
+            return sorted(self._find_catalogs(os.path.dirname(file_path)).values())
+
+        if os.path.basename(file_path) == 'pom.xml':
+            parents = []
+            try:
+                parent_path = self._find_parent(file_path)
+                while parent_path and parent_path not in parents:
+                    parents.append(parent_path)
+                    parent_path = self._find_parent(parent_path)
+            except (OSError, ET.ParseError):
+                pass
+            return parents
+
+        return []
+
     def _parse_pom_xml(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
 
         try:
-            namespaces = {'ns': 'http://maven.apache.org/POM/4.0.0'}
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-
-            if root.tag.startswith('{'):
-                deps_elements = root.findall('.//ns:dependencies/ns:dependency', namespaces)
-                if not deps_elements:
-                    deps_elements = root.findall('.//dependencies/dependency')
-            else:
-                deps_elements = root.findall('.//dependencies/dependency')
-
-            for dep in deps_elements:
-                group_id = None
-                artifact_id = None
-                version = 'latest'
-
-                if root.tag.startswith('{'):
-                    group_id_elem = dep.find('./ns:groupId', namespaces)
-                    artifact_id_elem = dep.find('./ns:artifactId', namespaces)
-                    version_elem = dep.find('./ns:version', namespaces)
-                else:
-                    group_id_elem = dep.find('./groupId')
-                    artifact_id_elem = dep.find('./artifactId')
-                    version_elem = dep.find('./version')
-
-                if group_id_elem is not None:
-                    group_id = group_id_elem.text
+            pom = self._read_pom(file_path)
+            properties, managed, _ = self._effective_pom(file_path)
 
-                if artifact_id_elem is not None:
-                    artifact_id = artifact_id_elem.text
-
-                if version_elem is not None:
-                    version = version_elem.text
+            for dependency in pom['dependencies']:
+                group_id = _interpolate(dependency.get('groupId'), properties)
+                artifact_id = _interpolate(dependency.get('artifactId'), properties)
+                version = _interpolate(dependency.get('version'), properties) or \
+                    managed.get((group_id, artifact_id), 'latest')
 
                 if group_id and artifact_id:
-                    library = f"{group_id}:{artifact_id}"
-                    dependencies.append(('Java', library, version))
+                    dependencies.append(('Java', f"{group_id}:{artifact_id}", version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
         return dependencies
 
+    def _read_pom(self, file_path: str) -> Dict:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._poms:
+            return self._poms[file_path]
+
+        pom = {'project': {}, 'parent': {}, 'properties': {}, 'managed': [], 'dependencies': []}
+        path = []
+        dependency = {}
+
+        for event, element in ET.iterparse(file_path, events=('start', 'end')):
+            tag = element.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                path.append(tag)
+                continue
+
+            text = element.text.strip() if element.text else ''
+            depth = len(path)
+
+            if path[-2:-1] == ['dependency']:
+                dependency[tag] = text
+            elif tag == 'dependency':
+                if path[1:-1] == ['dependencyManagement', 'dependencies']:
+                    pom['managed'].append(dependency)
+                    if dependency.get('scope') == 'import':
+                        pom['dependencies'].append(dependency)
+                elif path[-2:-1] == ['dependencies'] and tuple(path[1:-2]) in POM_DEPENDENCY_SECTIONS:
+                    pom['dependencies'].append(dependency)
+                dependency = {}
+            elif depth == 2:
+                pom['project'][tag] = text
+            elif depth == 3 and path[1] in ('parent', 'properties'):
+                pom[path[1]][tag] = text
+
+            path.pop()
+            element.clear()
+
+        self._poms[file_path] = pom
+        return pom
+
+    def _find_parent(self, file_path: str) -> Optional[str]:
+        parent = self._read_pom(file_path)['parent']
+        if not parent.get('artifactId'):
+            return None
+
+        directory = os.path.dirname(os.path.abspath(file_path))
+        candidates = []
+
+        relative_path = parent.get('relativePath', '../pom.xml')
+        if relative_path:
+            candidate = os.path.normpath(os.path.join(directory, relative_path))
+            candidates.append(os.path.join(candidate, 'pom.xml') if os.path.isdir(candidate) else candidate)
+
+        repo_path = os.path.abspath(self.repo_path)
+        while directory != repo_path and directory.startswith(repo_path + os.sep):
+            directory = os.path.dirname(directory)
+            candidates.append(os.path.join(directory, 'pom.xml'))
+
+        for candidate in candidates:
+            if candidate == os.path.abspath(file_path) or not os.path.isfile(candidate):
+                continue
+            project = self._read_pom(candidate)['project']
+            if project.get('artifactId') == parent['artifactId'] and \
+                    project.get('groupId', parent.get('groupId')) == parent.get('groupId'):
+                return candidate
+
+        return None
+
+    def _effective_pom(self, file_path: str) -> Tuple[Dict[str, str], Dict[Tuple[str, str], str], List[Dict]]:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._effective:
+            return self._effective[file_path]
+
+        self._effective[file_path] = ({}, {}, [])
+        pom = self._read_pom(file_path)
+        parent_path = self._find_parent(file_path)
+        parent_properties, _, parent_managed = self._effective_pom(parent_path) if parent_path else ({}, {}, [])
+
+        project = pom['project']
+        parent = pom['parent']
+        group_id = project.get('groupId') or parent.get('groupId', '')
+        version = project.get('version') or parent.get('version', '')
+
+        properties = dict(parent_properties)
+        properties.update(pom['properties'])
+        properties.update({
+            'project.groupId': group_id,
+            'project.artifactId': project.get('artifactId', ''),
+            'project.version': version,
+            'pom.groupId': group_id,
+            'pom.version': version,
+            'version': version,
+            'project.parent.groupId': parent.get('groupId', ''),
+            'project.parent.version': parent.get('version', ''),
+            'parent.version': parent.get('version', '')
+        })
+
+        declarations = parent_managed + pom['managed']
+        managed = {}
+        for dependency in declarations:
+            key = (_interpolate(dependency.get('groupId'), properties),
+                   _interpolate(dependency.get('artifactId'), properties))
+            if dependency.get('version'):
+                managed[key] = _interpolate(dependency['version'], properties)
+
+        self._effective[file_path] = (properties, managed, declarations)
+        return self._effective[file_path]
+
     def _parse_gradle_file(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
 
         try:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
                 content = file.read()
 
-            dependencies_block = re.search(r'dependencies\s*{(.*?)}', content, re.DOTALL)
-            if dependencies_block:
-                deps_content = dependencies_block.group(1)
-
-                pattern1 = r'(?:implementation|api|compile|testImplementation|testCompile|runtimeOnly|compileOnly)\s+[\'"]([^:\'\"]+):([^:\'\"]+):([^\'\"]+)[\'"]'
-                matches1 = re.finditer(pattern1, deps_content)
-                for match in matches1:
-                    group_id = match.group(1)
-                    artifact_id = match.group(2)
-                    version = match.group(3)
-                    library = f"{group_id}:{artifact_id}"
-                    dependencies.append(('Java', library, version))
+            statements, variables = self._gradle_statements(content)
+            catalogs = {name: self._load_catalog(path)
+                        for name, path in self._find_catalogs(os.path.dirname(file_path)).items()}
 
-                pattern2 = r'(?:implementation|api|compile|testImplementation|testCompile|runtimeOnly|compileOnly)\s+group:\s*[\'"]([^\'\"]+)[\'"],\s*name:\s*[\'"]([^\'\"]+)[\'"],\s*version:\s*[\'"]([^\'\"]+)[\'"]'
-                matches2 = re.finditer(pattern2, deps_content)
-                for match in matches2:
-                    group_id = match.group(1)
-                    artifact_id = match.group(2)
-                    version = match.group(3)
-                    library = f"{group_id}:{artifact_id}"
+            for statement in statements:
+                for library, version in self._gradle_coordinates(statement, catalogs):
+                    if '$' in version:
+                        version = _GRADLE_VARIABLE.sub(
+                            lambda match: variables.get(match.group(1).rsplit('.', 1)[-1], match.group()), version)
                     dependencies.append(('Java', library, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+    @staticmethod
+    def _gradle_statements(content: str) -> Tuple[List[List[Tuple[str, str]]], Dict[str, str]]:
+        statements = []
+        variables = {}
+        blocks = []
+        statement = []
+        depth = 0
+
+        def flush():
+            if not statement:
+                return
+            if blocks and blocks[-1][0] == 'dependencies':
+                statements.append(statement)
+                return
+
+            tokens = statement[1:] if statement[0][1] in _GRADLE_DECLARATIONS else statement
+            if len(tokens) == 3 and tokens[0][0] == 'name' and tokens[1][1] == '=' and tokens[2][0] == 'string':
+                variables[tokens[0][1].rsplit('.', 1)[-1]] = _unquote(tokens[2][1])
+
+        for match in _GRADLE_TOKEN.finditer(content):
+            kind = match.lastgroup
+            value = match.group()
+
+            if kind == 'comment':
+                continue
+
+            if kind == 'end':
+                if depth == 0:
+                    flush()
+                    statement = []
+                continue
+
+            if kind == 'punct':
+                if value in '([':
+                    depth += 1
+                elif value in ')]':
+                    depth = max(0, depth - 1)
+                elif value == '{':
+                    flush()
+                    blocks.append((statement[0][1] if statement and statement[0][0] == 'name' else '', depth))
+                    statement = []
+                    depth = 0
+                    continue
+                elif value == '}':
+                    flush()
+                    statement = []
+                    if blocks:
+                        depth = blocks.pop()[1]
+                    continue
+
+            statement.append((kind, value))
+
+        flush()
+
+        return statements, variables
+
+    @staticmethod
+    def _gradle_coordinates(statement: List[Tuple[str, str]], catalogs: Dict) -> List[Tuple[str, str]]:
+        coordinates = []
+        attributes = {}
+
+        for i in range(1, len(statement)):
+            kind, value = statement[i]
+            if kind == 'name':
+                if value in ('group', 'name', 'version') and i + 2 < len(statement) and \
+                        statement[i + 1][1] in (':', '=') and statement[i + 2][0] == 'string':
+                    attributes[value] = _unquote(statement[i + 2][1])
+                    continue
+
+                catalog_name, _, accessor = value.partition('.')
+                if catalog_name in catalogs:
+                    if accessor.endswith('.get'):
+                        accessor = accessor[:-4]
+                    coordinates.extend(catalogs[catalog_name].get(_catalog_key(accessor), []))
+
+            elif kind == 'string':
+                text = _unquote(value)
+                if ':' not in text or text.startswith(':') or ' ' in text:
+                    continue
+                parts = text.split('@', 1)[0].split(':')
+                if parts[0] and parts[1]:
+                    coordinates.append((f"{parts[0]}:{parts[1]}", parts[2] if len(parts) > 2 and parts[2] else 'latest'))
+
+        if 'group' in attributes and 'name' in attributes:
+            coordinates.append((f"{attributes['group']}:{attributes['name']}", attributes.get('version', 'latest')))
+
+        return coordinates
+
+    def _find_catalogs(self, directory: str) -> Dict[str, str]:
+        if directory in self._catalog_paths:
+            return self._catalog_paths[directory]
+
+        catalogs = {}
+        gradle_dir = os.path.join(directory, 'gradle')
+        if os.path.isdir(gradle_dir):
+            catalogs = {name[:-len(CATALOG_SUFFIX)]: os.path.join(gradle_dir, name)
+                        for name in sorted(os.listdir(gradle_dir)) if name.endswith(CATALOG_SUFFIX)}
+
+        parent = os.path.dirname(directory)
+        is_root = any(os.path.isfile(os.path.join(directory, name)) for name in GRADLE_SETTINGS)
+        if not catalogs and not is_root and parent != directory and \
+                os.path.abspath(directory) != os.path.abspath(self.repo_path):
+            catalogs = self._find_catalogs(parent)
+
+        self._catalog_paths[directory] = catalogs
+        return catalogs
+
+    def _load_catalog(self, catalog_path: str) -> Dict[str, List[Tuple[str, str]]]:
+        if catalog_path in self._catalogs:
+            return self._catalogs[catalog_path]
+
+        libraries = {}
+        try:
+            data = toml.load(catalog_path)
+            versions = data.get('versions', {})
+
+            def resolve(spec) -> str:
+                if isinstance(spec, str):
+                    return spec
+                if isinstance(spec, dict):
+                    if 'ref' in spec:
+                        return resolve(versions.get(spec['ref']))
+                    for key in ('strictly', 'require', 'prefer'):
+                        if key in spec:
+                            return spec[key]
+                return 'latest'
+
+            for alias, spec in data.get('libraries', {}).items():
+                if isinstance(spec, str):
+                    parts = spec.split(':')
+                    library, version = ':'.join(parts[:2]), parts[2] if len(parts) > 2 else 'latest'
+                else:
+                    library = spec.get('module') or f"{spec.get('group')}:{spec.get('name')}"
+                    version = resolve(spec.get('version'))
+                libraries[_catalog_key(alias)] = [(library, version)]
+
+            for alias, members in data.get('bundles', {}).items():
+                libraries[_catalog_key(f"bundles.{alias}")] = [
+                    coordinate for member in members for coordinate in libraries.get(_catalog_key(member), [])]
+
+        except Exception as e:
+            logs.error(f"Error parsing {catalog_path}: {e}")
+
+        self._catalogs[catalog_path] = libraries
+        return libraries
+
+    def _parse_gradle_lockfile(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            with open(file_path, 'r') as file:
+                for line in file:
+                    line = line.strip()
+                    if not line or line.startswith('#') or line.startswith('empty='):
+                        continue
+
+                    parts = line.split('=', 1)[0].split(':')
+                    if len(parts) >= 3:
+                        dependencies.append(('Java', f"{parts[0]}:{parts[1]}", parts[2]))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+
+def _unquote(token: str) -> str:
+    quote = 3 if token[:3] in ('"""', "'''") else 1
+    return token[quote:-quote]
+
+
+def _catalog_key(alias: str) -> str:
+    return alias.replace('-', '.').replace('_', '.').lower()
+
+
+def _interpolate(value: Optional[str], properties: Dict[str, str]) -> Optional[str]:
+    for _ in range(10):
+        if not value or '${' not in value:
+            break
+        resolved = _POM_PROPERTY.sub(lambda match: properties.get(match.group(1), match.group()), value)
+        if resolved == value:
+            break
+        value = resolved
+
+    return value
@@ -1,23 +1,25 @@
 import os
 import json
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import yaml
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
+from helpers.json_stream import JsonStream
 from helpers.log import logs
 
-class JavaScriptParser(Parser):
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
-    def find_dependency_files(self) -> List[str]:
-        dependency_files = []
-        js_dep_files = DEPENDENCY_FILES['JavaScript']
+class JavaScriptParser(Parser):
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in js_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+    version = '4'
 
-        return dependency_files
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['JavaScript'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -29,6 +31,8 @@ class JavaScriptParser(Parser):
             dependencies = self._parse_package_lock(file_path)
         elif filename == "yarn.lock":
             dependencies = self._parse_yarn_lock(file_path)
+        elif filename == "pnpm-lock.yaml":
+            dependencies = self._parse_pnpm_lock(file_path)
 
         return dependencies
 
@@ -56,19 +60,23 @@ class JavaScriptParser(Parser):
 
         try:
             with open(file_path, 'r') as file:
-                data = json.load(file)
-
-            if 'packages' in data:
-                for package_path, info in data['packages'].items():
-                    if package_path == '':  # Это сам проект
-                        continue
-                    package_name = package_path.split('node_modules/')[-1]
-                    version = info.get('version', 'latest')
-                    dependencies.append(('JavaScript', package_name, version))
-            elif 'dependencies' in data:
-                for package, info in data['dependencies'].items():
-                    version = info.get('version', 'latest')
-                    dependencies.append(('JavaScript', package, version))
+                stream = JsonStream(file)
+                lockfile_version = 1
+
+                for key in stream.iter_object():
+                    if key == 'lockfileVersion':
+                        lockfile_version = stream.read_value()
+                    elif key == 'packages':
+                        for package_path, info in stream.iter_items():
+                            if package_path == '':  # Это сам проект
+                                continue
+                            package_name = package_path.split('node_modules/')[-1]
+                            version = info.get('version', 'latest')
+                            dependencies.append(('JavaScript', package_name, version))
+                    elif key == 'dependencies' and lockfile_version < 2:
+                        for package, info in stream.iter_items():
+                            version = info.get('version', 'latest')
+                            dependencies.append(('JavaScript', package, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
@@ -80,27 +88,114 @@ class JavaScriptParser(Parser):
 
         try:
             with open(file_path, 'r') as file:
-                content = file.read()
-
-            package_sections = content.split('\n\n')
-            for section in package_sections:
-                if not section.strip():
-                    continue
-
-                first_line = section.split('\n')[0].strip()
-                if first_line.startswith('"') and '@' in first_line:
-                    # Это запись о пакете
-                    package_spec = first_line.strip('"')
-                    package_name = package_spec.split('@')[0]
-
-                    version_line = [line for line in section.split('\n') if '  version' in line]
-                    if version_line:
-                        version = version_line[0].split('"')[1]
-                        dependencies.append(('JavaScript', package_name, version))
+                package_name = None
+                version = None
+
+                for line in file:
+                    if line[0] == ' ':
+                        if version is None and package_name and line.startswith('  version') and \
+                                line[9:10] in (' ', ':'):
+                            version = line[10:].strip().strip('"')
+                            dependencies.append(('JavaScript', package_name, version))
+                    elif line[0] not in '#\r\n':
+                        if package_name and version is None:
+                            dependencies.append(('JavaScript', package_name, 'unknown'))
+                        package_name = self._yarn_package_name(line)
+                        version = None
+
+                if package_name and version is None:
+                    dependencies.append(('JavaScript', package_name, 'unknown'))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+    def _parse_pnpm_lock(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            with open(file_path, 'r') as file:
+                lockfile_version = '9'
+                # one [key, expecting_key] per open collection; expecting_key is None for sequences
+                stack = []
+                fields = {}
+
+                # Walking parser events skips building the document, which costs far more than parsing it
+                for event in yaml.parse(file, Loader=YamlLoader):
+                    kind = event.__class__
+
+                    if kind is yaml.ScalarEvent or kind is yaml.AliasEvent:
+                        if stack and stack[-1][1]:
+                            stack[-1][0] = getattr(event, 'value', None)
+                            stack[-1][1] = False
+                            continue
+
+                        depth = len(stack)
+                        if depth == 1 and stack[0][0] == 'lockfileVersion':
+                            lockfile_version = event.value
+                        elif depth == 3 and stack[0][0] == 'packages' and stack[2][0] in ('name', 'version'):
+                            fields[stack[2][0]] = event.value
+                        elif depth == 2 and stack[0][0] == 'packages':
+                            self._add_pnpm_package(dependencies, stack[1][0], {}, lockfile_version)
+
+                    elif kind is yaml.MappingStartEvent or kind is yaml.SequenceStartEvent:
+                        if len(stack) == 2 and stack[0][0] == 'packages':
+                            fields = {}
+                        stack.append([None, True if kind is yaml.MappingStartEvent else None])
+                        continue
+
+                    elif kind is yaml.MappingEndEvent or kind is yaml.SequenceEndEvent:
+                        stack.pop()
+                        if len(stack) == 2 and stack[0][0] == 'packages':
+                            self._add_pnpm_package(dependencies, stack[1][0], fields, lockfile_version)
+                        elif len(stack) == 1 and stack[0][0] == 'packages':
+                            break
+
                     else:
-                        dependencies.append(('JavaScript', package_name, 'unknown'))
+                        continue
+
+                    if stack and stack[-1][1] is False:
+                        stack[-1][1] = True
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+    @staticmethod
+    def _add_pnpm_package(dependencies: List[Tuple[str, str, str]], key: str, fields: Dict[str, str],
+                          lockfile_version: str):
+        package = _pnpm_package(key, fields, lockfile_version)
+        if package:
+            dependencies.append(('JavaScript', package[0], package[1]))
+
+    @staticmethod
+    def _yarn_package_name(header: str):
+        # classic: `"@scope/a@^1.0.0", a@^1.1.0:`, berry: `"@scope/a@npm:^1.0.0, a@npm:^1.1.0":`
+        descriptor = header.rstrip().rstrip(':').split(',')[0].strip().strip('"')
+        if descriptor == '__metadata' or '@workspace:' in descriptor:
+            return None
+
+        separator = descriptor.find('@', 1)
+        return descriptor[:separator] if separator > 0 else descriptor
+
+
+def _pnpm_package(key: str, fields: Dict[str, str], lockfile_version: str) -> Optional[Tuple[str, str]]:
+    if fields.get('name') and fields.get('version'):
+        return fields['name'], fields['version']
+
+    # v5: `/name/1.0.0_peer@2.0.0`, v6: `/name@1.0.0(peer@2.0.0)`, v9: `name@1.0.0`
+    key = str(key).lstrip('/').split('(', 1)[0]
+    if str(lockfile_version).split('.')[0] in ('5', '4', '3'):
+        name, _, version = key.rpartition('/')
+        version = version.split('_', 1)[0]
+    else:
+        name, _, version = key[1:].rpartition('@')
+        name = key[0] + name if name else ''
+
+    # link:, file: and tarball URLs are local or unversioned
+    if not name or not version or ':' in version:
+        return None
+
+    return name, version
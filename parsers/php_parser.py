@@ -4,21 +4,13 @@ from typing import List, Tuple
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
+from helpers.json_stream import JsonStream
 from helpers.log import logs
 
 class PhpParser(Parser):
 
     def find_dependency_files(self) -> List[str]:
-
-        dependency_files = []
-        php_dep_files = DEPENDENCY_FILES['PHP']
-
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in php_dep_files:
-                    dependency_files.append(os.path.join(root, file))
-
-        return dependency_files
+        return self.file_index.find(DEPENDENCY_FILES['PHP'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -65,21 +57,17 @@ class PhpParser(Parser):
 
         try:
             with open(file_path, 'r') as file:
-                data = json.load(file)
+                stream = JsonStream(file)
+
+                for key in stream.iter_object():
+                    if key not in ('packages', 'packages-dev'):
+                        continue
 
-            if 'packages' in data:
-                for package in data['packages']:
-                    if 'name' in package and 'version' in package:
-                        name = package['name']
-                        version = package['version']
-                        dependencies.append(('PHP', name, version))
-
-            if 'packages-dev' in data:
-                for package in data['packages-dev']:
-                    if 'name' in package and 'version' in package:
-                        name = package['name']
-                        version = package['version']
-                        dependencies.append(('PHP', name, version))
+                    for package in stream.iter_values():
+                        if 'name' in package and 'version' in package:
+                            name = package['name']
+                            version = package['version']
+                            dependencies.append(('PHP', name, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
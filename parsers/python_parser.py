@@ -1,24 +1,27 @@
 import os
 import re
-from typing import List, Tuple
-import pkg_resources
+from typing import Dict, List, Tuple
+from helpers.json_stream import JsonStream
 from helpers.log import logs
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
 
+PYTHON_LOCK_FILES = ('poetry.lock', 'uv.lock', 'pdm.lock')
+_REQUIREMENT_OPTION = re.compile(r'^(?:(-r|-c)\s*|(--requirement|--constraint)(?:\s*=\s*|\s+))(\S+)')
+_LOCK_FIELD = re.compile(r'(name|version|source)\s*=\s*(.*)')
+
 
 class PythonParser(Parser):
 
-    def find_dependency_files(self) -> List[str]:
-        dependency_files = []
-        python_dep_files = DEPENDENCY_FILES['Python']
+    version = '3'
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in python_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._requirement_files = {}
+        self._resolved = {}
 
-        return dependency_files
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['Python'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -26,6 +29,8 @@ class PythonParser(Parser):
 
         if filename == "requirements.txt":
             dependencies = self._parse_requirements_txt(file_path)
+        elif filename in PYTHON_LOCK_FILES:
+            dependencies = self._parse_lock(file_path)
         elif filename == "pyproject.toml":
             dependencies = self._parse_pyproject_toml(file_path)
         elif filename == "setup.py":
@@ -35,8 +40,72 @@ class PythonParser(Parser):
 
         return dependencies
 
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        if os.path.basename(file_path) != 'requirements.txt':
+            return []
+
+        file_path = os.path.abspath(file_path)
+        try:
+            requirements, constraints = self._resolve_requirements(file_path)
+        except OSError:
+            return []
+
+        return sorted((set(requirements) | set(constraints)) - {file_path})
+
     def _parse_requirements_txt(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
+        file_path = os.path.abspath(file_path)
+
+        try:
+            requirements, constraints = self._resolve_requirements(file_path)
+            pins = {}
+            for constraint_path in constraints:
+                for package_name, version, pinned in self._read_requirements(constraint_path)['requirements']:
+                    if pinned:
+                        pins.setdefault(package_name.lower(), version)
+
+            for requirement_path in dict.fromkeys([file_path] + requirements):
+                for package_name, version, pinned in self._read_requirements(requirement_path)['requirements']:
+                    if not pinned:
+                        version = pins.get(package_name.lower(), version)
+                    dependencies.append(('Python', package_name, version))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
+
+    def _resolve_requirements(self, file_path: str) -> Tuple[List[str], List[str]]:
+        # files pulled in with -r and -c, in order; shared includes are resolved once per scan
+        if file_path in self._resolved:
+            return self._resolved[file_path]
+
+        self._resolved[file_path] = ([], [])
+        requirements = []
+        constraints = []
+
+        requirement_file = self._read_requirements(file_path)
+        for include_path in requirement_file['includes']:
+            if os.path.isfile(include_path):
+                nested_requirements, nested_constraints = self._resolve_requirements(include_path)
+                requirements.extend([include_path] + nested_requirements)
+                constraints.extend(nested_constraints)
+
+        for constraint_path in requirement_file['constraints']:
+            if os.path.isfile(constraint_path):
+                nested_requirements, nested_constraints = self._resolve_requirements(constraint_path)
+                constraints.extend([constraint_path] + nested_requirements + nested_constraints)
+
+        resolved = (list(dict.fromkeys(requirements)), list(dict.fromkeys(constraints)))
+        self._resolved[file_path] = resolved
+        return resolved
+
+    def _read_requirements(self, file_path: str) -> Dict:
+        if file_path in self._requirement_files:
+            return self._requirement_files[file_path]
+
+        requirement_file = {'requirements': [], 'includes': [], 'constraints': []}
+        directory = os.path.dirname(file_path)
 
         with open(file_path, 'r') as file:
             for line in file:
@@ -44,13 +113,52 @@ class PythonParser(Parser):
                 if not line or line.startswith('#'):
                     continue
 
-                match = re.match(r'^([\w\-\[\]]+)(?:===|==|>=|<=|~=|>|<)?([^;,\s]*)', line)
+                if line.startswith('-'):
+                    option = _REQUIREMENT_OPTION.match(line)
+                    if option and '://' not in option.group(3):
+                        flag = option.group(1) or option.group(2)
+                        target = 'includes' if flag in ('-r', '--requirement') else 'constraints'
+                        requirement_file[target].append(os.path.normpath(os.path.join(directory, option.group(3))))
+                    continue
+
+                match = re.match(r'^([\w\-\[\]]+)(===|==|>=|<=|~=|>|<)?([^;,\s]*)', line)
                 if match:
                     package_name = match.group(1)
-                    version = match.group(2)
-                    dependencies.append(('Python', package_name, version))
+                    version = match.group(3)
+                    requirement_file['requirements'].append((package_name, version, match.group(2) in ('==', '===')))
                 else:
-                    dependencies.append(('Python', line, 'latest'))
+                    requirement_file['requirements'].append((line, 'latest', False))
+
+        self._requirement_files[file_path] = requirement_file
+        return requirement_file
+
+    def _parse_lock(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
+
+        try:
+            packages = []
+            package = None
+
+            # poetry, uv and pdm locks are [[package]] arrays; only their flat name/version/source keys are read
+            with open(file_path, 'r') as file:
+                for line in file:
+                    if line.startswith('['):
+                        packages.append(package)
+                        package = {} if line.rstrip() == '[[package]]' else None
+                    elif package is not None:
+                        field = _LOCK_FIELD.match(line)
+                        if field:
+                            package[field.group(1)] = field.group(2).strip().strip('"')
+            packages.append(package)
+
+            for package in packages:
+                # uv lists the project itself and workspace members as editable or virtual sources
+                if package and 'name' in package and 'version' in package and \
+                        not any(local in package.get('source', '') for local in ('editable', 'virtual')):
+                    dependencies.append(('Python', package['name'], package['version']))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
 
         return dependencies
 
@@ -111,16 +219,18 @@ class PythonParser(Parser):
 
         if file_path.endswith('Pipfile.lock'):
             try:
-                import json
                 with open(file_path, 'r') as file:
-                    data = json.load(file)
+                    stream = JsonStream(file)
 
-                if 'default' in data:
-                    for package, info in data['default'].items():
-                        version = info.get('version', 'latest')
-                        if version.startswith('=='):
-                            version = version[2:]
-                        dependencies.append(('Python', package, version))
+                    for key in stream.iter_object():
+                        if key != 'default':
+                            continue
+
+                        for package, info in stream.iter_items():
+                            version = info.get('version', 'latest')
+                            if version.startswith('=='):
+                                version = version[2:]
+                            dependencies.append(('Python', package, version))
             except Exception as e:
                 logs.error(f"Error parsing {file_path}: {e}")
         else:  # Pipfile
@@ -137,4 +247,5 @@ class PythonParser(Parser):
             except Exception as e:
                 logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
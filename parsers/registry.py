@@ -0,0 +1,88 @@
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, List, Optional
+
+from consts.dependency_files import DEPENDENCY_FILES
+from consts.file_extensions import LANGUAGE_EXTENSIONS
+from helpers.log import logs
+
+ENTRY_POINT_GROUP = 'boomer.parsers'
+
+BUILTIN_PARSERS = {
+    'Python': 'parsers.python_parser:PythonParser',
+    'JavaScript': 'parsers.java_script_parser:JavaScriptParser',
+    'Java': 'parsers.java_parser:JavaParser',
+    'C++': 'parsers.cpp_parser:CppParser',
+    'C#': 'parsers.csharp_parser:CSharpParser',
+    'Go': 'parsers.go_parser:GoParser',
+    'Rust': 'parsers.rust_parser:RustParser',
+    'PHP': 'parsers.php_parser:PhpParser',
+    'Ruby': 'parsers.ruby_parcer:RubyParser'
+}
+
+
+def load_class(entry: str) -> type:
+    module_name, _, class_name = entry.partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ParserRegistry:
+
+    def __init__(self, parsers: Dict[str, str] = None, use_entry_points: bool = True):
+        self._parsers = dict(BUILTIN_PARSERS if parsers is None else parsers)
+        self._use_entry_points = use_entry_points
+        self._classes = {}
+
+    def _discover(self):
+        if not self._use_entry_points:
+            return
+
+        self._use_entry_points = False
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            self._parsers[entry_point.name] = entry_point.value
+
+    def languages(self) -> List[str]:
+        self._discover()
+        return list(self._parsers)
+
+    def get(self, language: str) -> Optional[type]:
+        if language not in self._classes:
+            self._discover()
+            entry = self._parsers.get(language)
+            if entry is None:
+                return None
+
+            try:
+                self._classes[language] = load_class(entry)
+            except (ImportError, AttributeError) as e:
+                logs.error(f"Error loading parser {entry} for {language}: {e}")
+                self._classes[language] = None
+
+        return self._classes[language]
+
+    def _declared(self, language: str, attribute: str) -> Optional[List[str]]:
+        # built-in parsers are described in consts, so their modules are not imported here
+        if self._parsers.get(language) == BUILTIN_PARSERS.get(language):
+            return None
+
+        return getattr(self.get(language), attribute, None)
+
+    def dependency_files(self) -> Dict[str, List[str]]:
+        files = {}
+        for language in self.languages():
+            declared = self._declared(language, 'dependency_files')
+            files[language] = list(declared) if declared is not None else DEPENDENCY_FILES.get(language, [])
+
+        return files
+
+    def extension_languages(self) -> Dict[str, str]:
+        languages = {}
+        for language in self.languages():
+            declared = self._declared(language, 'extensions')
+            for extension in (declared if declared is not None else LANGUAGE_EXTENSIONS.get(language, [])):
+                languages[extension.lower()] = language
+
+        return languages
+
+
+default_registry = ParserRegistry()
@@ -6,19 +6,22 @@ from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
 from helpers.log import logs
 
-class RubyParser(Parser):
+LOCK_SOURCES = ('GEM', 'GIT', 'PATH')
+_GEM = re.compile(r'^gem\s*\(?\s*[\'"]([^\'"]+)[\'"](.*)')
+_GEM_VERSION = re.compile(r'^\s*,\s*[\'"]([^\'"]+)[\'"]')
+_GEM_VERSION_OPTION = re.compile(r'(?::version\s*=>|\bversion:)\s*[\'"]([^\'"]+)[\'"]')
+_LOCK_ENTRY = re.compile(r'([^\s(!]+)(?: \(([^)]*)\))?!?$')
 
-    def find_dependency_files(self) -> List[str]:
+class RubyParser(Parser):
 
-        dependency_files = []
-        ruby_dep_files = DEPENDENCY_FILES['Ruby']
+    version = '3'
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in ruby_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._locks = {}
 
-        return dependency_files
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['Ruby'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -31,24 +34,42 @@ class RubyParser(Parser):
 
         return dependencies
 
+    def dependency_edges(self, file_path: str) -> List[Tuple[Tuple[str, str, str], Tuple[str, str, str]]]:
+        if os.path.basename(file_path) != 'Gemfile.lock':
+            return []
+
+        edges = []
+
+        try:
+            specs = [spec for spec in self._read_gemfile_lock(file_path) if spec[2] != 'PATH']
+            versions = {}
+            for name, version, _, _ in specs:
+                versions.setdefault(name, version)
+
+            # child edges name a requirement, resolved here to the version locked for that gem
+            for name, version, _, children in specs:
+                for child in children:
+                    if child in versions:
+                        edges.append((('Ruby', name, version), ('Ruby', child, versions[child])))
+
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return list(dict.fromkeys(edges))
+
     def _parse_gemfile(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
 
         try:
             with open(file_path, 'r') as file:
-                content = file.read()
-
-            gem_pattern = r'gem\s+[\'"]([^\'"]+)[\'"](?:\s*,\s*[\'"]([^\'"]+)[\'"])?'
-            for match in re.finditer(gem_pattern, content):
-                gem_name = match.group(1)
-                version = match.group(2) if match.group(2) else 'latest'
-                dependencies.append(('Ruby', gem_name, version))
+                for line in file:
+                    match = _GEM.match(line.strip())
+                    if not match:
+                        continue
 
-            gem_version_pattern = r'gem\s+[\'"]([^\'"]+)[\'"](?:.*?:version\s*=>\s*[\'"]([^\'"]+)[\'"])?'
-            for match in re.finditer(gem_version_pattern, content):
-                gem_name = match.group(1)
-                version = match.group(2) if match.group(2) else 'latest'
-                dependencies.append(('Ruby', gem_name, version))
+                    arguments = match.group(2).split('#', 1)[0]
+                    version = _GEM_VERSION.match(arguments) or _GEM_VERSION_OPTION.search(arguments)
+                    dependencies.append(('Ruby', match.group(1), version.group(1) if version else 'latest'))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
@@ -59,29 +80,50 @@ class RubyParser(Parser):
         dependencies = []
 
         try:
-            with open(file_path, 'r') as file:
-                content = file.readlines()
-
-            in_specs = False
-            for line in content:
-                line = line.strip()
-
-                if line == "GEM":
-                    in_specs = True
-                    continue
+            emitted = set()
 
-                if in_specs and line.startswith("  "):
-                    if re.match(r'    [a-zA-Z0-9_-]+\s+\(', line):
-                        match = re.match(r'    ([a-zA-Z0-9_-]+)\s+\(([^)]+)\)', line)
-                        if match:
-                            gem_name = match.group(1)
-                            version = match.group(2)
-                            dependencies.append(('Ruby', gem_name, version))
-
-                if in_specs and line and not line.startswith(" "):
-                    in_specs = False
+            # PATH specs are gems from the repository itself
+            for name, version, source, _ in self._read_gemfile_lock(file_path):
+                if source != 'PATH' and (name, version) not in emitted:
+                    emitted.add((name, version))
+                    dependencies.append(('Ruby', name, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
-        return dependencies
\ No newline at end of file
+        return dependencies
+
+    def _read_gemfile_lock(self, file_path: str) -> List[Tuple[str, str, str, List[str]]]:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._locks:
+            return self._locks[file_path]
+
+        # 4-space spec lines of the source sections with their 6-space child edges; PLATFORMS and DEPENDENCIES
+        # add no versions of their own
+        specs = []
+        section = None
+        children = None
+
+        with open(file_path, 'r') as file:
+            for line in file:
+                line = line.rstrip()
+                if not line:
+                    continue
+
+                indent = len(line) - len(line.lstrip(' '))
+                if indent == 0:
+                    section = line
+                    children = None
+                elif section in LOCK_SOURCES and indent == 4:
+                    entry = _LOCK_ENTRY.match(line, 4)
+                    if entry:
+                        # `1.15.4-x86_64-linux`: platform variants of one version share the version
+                        children = []
+                        specs.append((entry.group(1), (entry.group(2) or '').split('-', 1)[0], section, children))
+                elif section in LOCK_SOURCES and indent == 6 and children is not None:
+                    edge = _LOCK_ENTRY.match(line, 6)
+                    if edge:
+                        children.append(edge.group(1))
+
+        self._locks[file_path] = specs
+        return specs
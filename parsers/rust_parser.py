@@ -1,23 +1,30 @@
+import fnmatch
 import os
+import posixpath
 import re
 import toml
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .base_parser import Parser
 from consts.dependency_files import DEPENDENCY_FILES
 from helpers.log import logs
 
+DEPENDENCY_TABLES = ('dependencies', 'dev-dependencies', 'build-dependencies')
+_LOCK_FIELD = re.compile(r'(name|version|source)\s*=\s*"([^"]*)"')
+_VERSION_REQUIREMENT = re.compile(r'[\^~=]?\s*(\d+)(?:\.(\d+))?(?:\.(\d+))?')
+
 class RustParser(Parser):
-    def find_dependency_files(self) -> List[str]:
-        dependency_files = []
-        rust_dep_files = DEPENDENCY_FILES['Rust']
 
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file in rust_dep_files:
-                    dependency_files.append(os.path.join(root, file))
+    version = '2'
 
-        return dependency_files
+    def __init__(self, repo_path: str, file_index=None):
+        super().__init__(repo_path, file_index)
+        self._manifests = {}
+        self._workspace_roots = {}
+        self._locks = {}
+
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(DEPENDENCY_FILES['Rust'])
 
     def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
@@ -30,107 +37,169 @@ class RustParser(Parser):
 
         return dependencies
 
-    def _parse_cargo_toml(self, file_path: str) -> List[Tuple[str, str, str]]:
-        dependencies = []
+    def dependency_inputs(self, file_path: str) -> List[str]:
+        if os.path.basename(file_path) != 'Cargo.toml':
+            return []
 
         try:
-            data = toml.load(file_path)
-
-            if 'dependencies' in data:
-                for package, config in data['dependencies'].items():
-                    version = 'latest'
-
-                    if isinstance(config, str):
-                        version = config
-                    elif isinstance(config, dict):
-                        if 'version' in config:
-                            version = config['version']
-
-                    dependencies.append(('Rust', package, version))
-
-            if 'dev-dependencies' in data:
-                for package, config in data['dev-dependencies'].items():
-                    version = 'latest'
+            root_path = self._workspace_root(os.path.abspath(file_path))
+        except (OSError, toml.TomlDecodeError):
+            return []
 
-                    if isinstance(config, str):
-                        version = config
-                    elif isinstance(config, dict) and 'version' in config:
-                        version = config['version']
+        inputs = [] if root_path == os.path.abspath(file_path) else [root_path]
+        lock_path = os.path.join(os.path.dirname(root_path), 'Cargo.lock')
+        if os.path.isfile(lock_path):
+            inputs.append(lock_path)
 
-                    dependencies.append(('Rust', package, version))
+        return inputs
 
-            if 'build-dependencies' in data:
-                for package, config in data['build-dependencies'].items():
-                    version = 'latest'
+    def _parse_cargo_toml(self, file_path: str) -> List[Tuple[str, str, str]]:
+        dependencies = []
 
-                    if isinstance(config, str):
-                        version = config
-                    elif isinstance(config, dict) and 'version' in config:
-                        version = config['version']
+        try:
+            file_path = os.path.abspath(file_path)
+            data = self._read_manifest(file_path)
 
-                    dependencies.append(('Rust', package, version))
+            root_path = self._workspace_root(file_path)
+            workspace = self._read_manifest(root_path).get('workspace', {}).get('dependencies', {})
+            lock_path = os.path.join(os.path.dirname(root_path), 'Cargo.lock')
+            locked = self._locked_versions(lock_path) if os.path.isfile(lock_path) else {}
 
-            if 'target' in data:
-                for _, target_config in data['target'].items():
-                    if 'dependencies' in target_config:
-                        for package, config in target_config['dependencies'].items():
-                            version = 'latest'
+            tables = [data] + [target for target in data.get('target', {}).values() if isinstance(target, dict)]
+            for table in tables:
+                for section in DEPENDENCY_TABLES:
+                    for key, config in table.get(section, {}).items():
+                        if isinstance(config, dict) and config.get('workspace') is True:
+                            config = workspace.get(key, {})
 
-                            if isinstance(config, str):
-                                version = config
-                            elif isinstance(config, dict) and 'version' in config:
-                                version = config['version']
+                        dependency = _dependency(key, config)
+                        if dependency is None:
+                            continue
 
-                            dependencies.append(('Rust', package, version))
+                        package, version = dependency
+                        version = _locked_version(locked.get(package, ()), version) or version
+                        dependencies.append(('Rust', package, version))
 
         except Exception as e:
             logs.error(f"Error parsing {file_path}: {e}")
 
         return dependencies
 
+    def _read_manifest(self, file_path: str) -> Dict:
+        if file_path not in self._manifests:
+            self._manifests[file_path] = toml.load(file_path)
+
+        return self._manifests[file_path]
+
+    def _workspace_root(self, manifest_path: str) -> str:
+        data = self._read_manifest(manifest_path)
+        if 'workspace' in data:
+            return manifest_path
+
+        package = data.get('package', {})
+        if isinstance(package.get('workspace'), str):
+            return os.path.normpath(os.path.join(os.path.dirname(manifest_path), package['workspace'], 'Cargo.toml'))
+
+        root_path = self._find_workspace(os.path.dirname(os.path.dirname(manifest_path)))
+        if root_path is None:
+            return manifest_path
+
+        workspace = self._read_manifest(root_path)['workspace']
+        member = os.path.relpath(os.path.dirname(manifest_path), os.path.dirname(root_path)).replace(os.sep, '/')
+        if any(fnmatch.fnmatchcase(member, posixpath.normpath(pattern)) for pattern in workspace.get('members', [])) and \
+                member not in [posixpath.normpath(pattern) for pattern in workspace.get('exclude', [])]:
+            return root_path
+
+        return manifest_path
+
+    def _find_workspace(self, directory: str) -> Optional[str]:
+        if directory in self._workspace_roots:
+            return self._workspace_roots[directory]
+
+        repo_path = os.path.abspath(self.repo_path)
+        if directory != repo_path and not directory.startswith(repo_path + os.sep):
+            return None
+
+        candidate = os.path.join(directory, 'Cargo.toml')
+        if os.path.isfile(candidate) and 'workspace' in self._read_manifest(candidate):
+            root_path = candidate
+        elif directory == repo_path:
+            root_path = None
+        else:
+            root_path = self._find_workspace(os.path.dirname(directory))
+
+        self._workspace_roots[directory] = root_path
+        return root_path
+
+    def _read_lock(self, file_path: str) -> List[Tuple[str, str, Optional[str]]]:
+        file_path = os.path.abspath(file_path)
+        if file_path in self._locks:
+            return self._locks[file_path]
+
+        packages = []
+        package = None
+
+        # [[package]] tables are flat, so their fields are read line by line instead of loading the whole TOML
+        with open(file_path, 'r') as file:
+            for line in file:
+                if line.startswith('['):
+                    if package and 'name' in package and 'version' in package:
+                        packages.append((package['name'], package['version'], package.get('source')))
+                    package = {} if line.rstrip() == '[[package]]' else None
+                elif package is not None:
+                    match = _LOCK_FIELD.match(line)
+                    if match:
+                        package[match.group(1)] = match.group(2)
+
+        if package and 'name' in package and 'version' in package:
+            packages.append((package['name'], package['version'], package.get('source')))
+
+        self._locks[file_path] = packages
+        return packages
+
+    def _locked_versions(self, file_path: str) -> Dict[str, List[str]]:
+        versions = {}
+        for name, version, source in self._read_lock(file_path):
+            if source:
+                versions.setdefault(name, []).append(version)
+
+        return versions
+
     def _parse_cargo_lock(self, file_path: str) -> List[Tuple[str, str, str]]:
         dependencies = []
-        seen_packages = set()
 
         try:
-            data = toml.load(file_path)
+            # crates without a source are workspace members or path dependencies
+            dependencies = [('Rust', name, version) for name, version, source in self._read_lock(file_path) if source]
 
-            if 'package' in data:
-                for package in data['package']:
-                    if 'name' in package and 'version' in package:
-                        name = package['name']
-                        version = package['version']
+        except Exception as e:
+            logs.error(f"Error parsing {file_path}: {e}")
+
+        return dependencies
 
-                        if name not in seen_packages:
-                            seen_packages.add(name)
-                            dependencies.append(('Rust', name, version))
 
-            elif 'dependencies' in data:
-                for dep in data['dependencies']:
-                    if isinstance(dep, dict) and 'name' in dep and 'version' in dep:
-                        name = dep['name']
-                        version = dep['version']
+def _dependency(key: str, config) -> Optional[Tuple[str, str]]:
+    if isinstance(config, str):
+        return key, config
+    if not isinstance(config, dict):
+        return key, 'latest'
 
-                        if name not in seen_packages:
-                            seen_packages.add(name)
-                            dependencies.append(('Rust', name, version))
+    if 'path' in config and 'version' not in config and 'git' not in config:
+        return None
 
-        except Exception as e:
-            try:
-                with open(file_path, 'r') as file:
-                    content = file.read()
+    return config.get('package', key), config.get('version', 'latest')
 
-                packages = re.finditer(r'\[\[package\]\]\s+name\s*=\s*"([^"]+)"\s+version\s*=\s*"([^"]+)"', content,
-                                       re.DOTALL)
-                for match in packages:
-                    name = match.group(1)
-                    version = match.group(2)
 
-                    if name not in seen_packages:
-                        seen_packages.add(name)
-                        dependencies.append(('Rust', name, version))
+def _locked_version(candidates: List[str], requirement: str) -> Optional[str]:
+    match = _VERSION_REQUIREMENT.match(requirement)
+    if not match:
+        return candidates[0] if len(candidates) == 1 else None
 
-            except Exception as inner_e:
-                logs.error(f"Error parsing {file_path}: {e} -> {inner_e}")
+    # caret-compatible: everything up to the first non-zero component must match
+    wanted = [part for part in match.groups() if part is not None]
+    significant = next((i + 1 for i, part in enumerate(wanted) if part != '0'), len(wanted))
+    for candidate in candidates:
+        if candidate.split('.')[:significant] == wanted[:significant]:
+            return candidate
 
-        return dependencies
\ No newline at end of file
+    return None
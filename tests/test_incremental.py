@@ -0,0 +1,90 @@
+import json
+import subprocess
+
+import pytest
+
+from helpers.incremental import git_changed_files
+from helpers.runner import run_scan
+
+
+def _git(repo_path, *args):
+    subprocess.run(['git', '-C', str(repo_path), '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / 'app.py').write_text('import requests\n')
+    (tmp_path / 'requirements.txt').write_text('requests==2.31.0\n')
+    (tmp_path / 'tools').mkdir()
+    (tmp_path / 'tools' / 'requirements.txt').write_text('six==1.16.0\n')
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'add', '-A')
+    _git(tmp_path, 'commit', '-q', '-m', 'initial')
+
+    return tmp_path
+
+
+def _components(report_path):
+    with open(report_path, 'r') as file:
+        return sorted(component['name'] for component in json.load(file)['components']
+                      if component.get('bom-ref') != 'project')
+
+
+@pytest.mark.parametrize('ignore_file', ['.gitignore', '.boomerignore', 'tools/.gitignore'])
+def test_ignore_file_change_forces_full_scan(repo, tmp_path_factory, ignore_file):
+    output_dir = tmp_path_factory.mktemp('reports')
+    previous_path = str(output_dir / 'previous.json')
+    run_scan(str(repo), previous_path)
+    assert _components(previous_path) == ['requests', 'six']
+
+    if ignore_file.startswith('tools/'):
+        (repo / ignore_file).write_text('requirements.txt\n')
+    else:
+        (repo / ignore_file).write_text('tools/\n')
+
+    with pytest.raises(ValueError):
+        git_changed_files(str(repo), 'HEAD')
+
+    output_path = str(output_dir / 'report.json')
+    run_scan(str(repo), output_path, since='HEAD', previous_path=previous_path)
+    assert _components(output_path) == ['requests']
+
+
+def _scan_after(repo, tmp_path_factory, change):
+    output_dir = tmp_path_factory.mktemp('reports')
+    previous_path = str(output_dir / 'previous.json')
+    run_scan(str(repo), previous_path)
+    previous = _components(previous_path)
+
+    change()
+    output_path = str(output_dir / 'report.json')
+    run_scan(str(repo), output_path, since='HEAD', previous_path=previous_path)
+    full_path = str(output_dir / 'full.json')
+    run_scan(str(repo), full_path)
+
+    return previous, _components(output_path), _components(full_path)
+
+
+def test_first_file_of_a_language_parses_unchanged_manifests(repo, tmp_path_factory):
+    (repo / 'app.py').unlink()
+    _git(repo, 'commit', '-q', '-am', 'no python sources')
+
+    previous, incremental, full = _scan_after(repo, tmp_path_factory,
+                                              lambda: (repo / 'main.py').write_text('import six\n'))
+
+    assert previous == []
+    assert incremental == full == ['requests', 'six']
+
+
+def test_shared_input_change_reparses_dependents_without_components(repo, tmp_path_factory):
+    (repo / 'requirements.txt').write_text('-r base.txt\n')
+    (repo / 'base.txt').write_text('')
+    _git(repo, 'add', '-A')
+    _git(repo, 'commit', '-q', '-m', 'empty base')
+
+    previous, incremental, full = _scan_after(repo, tmp_path_factory,
+                                              lambda: (repo / 'base.txt').write_text('requests==2.31.0\n'))
+
+    assert previous == ['six']
+    assert incremental == full == ['requests', 'six']
@@ -0,0 +1,22 @@
+from parsers.java_script_parser import JavaScriptParser
+
+
+def _parse(tmp_path, content: str):
+    lock_path = tmp_path / 'yarn.lock'
+    lock_path.write_text(content)
+
+    return JavaScriptParser(str(tmp_path)).parse_dependencies(str(lock_path))
+
+
+def test_yarn_lock_versions(tmp_path):
+    dependencies = _parse(tmp_path, '# yarn lockfile v1\n\n'
+                                    'lodash@^4.17.0:\n  version "4.17.21"\n  resolved "https://example"\n\n'
+                                    '"@babel/core@npm:^7.0.0":\n  version: 7.23.0\n')
+
+    assert dependencies == [('JavaScript', 'lodash', '4.17.21'), ('JavaScript', '@babel/core', '7.23.0')]
+
+
+def test_yarn_lock_truncated_version_line(tmp_path):
+    dependencies = _parse(tmp_path, 'lodash@^4.17.0:\n  version "4.17.21"\n\nleft-pad@^1.3.0:\n  version')
+
+    assert dependencies == [('JavaScript', 'lodash', '4.17.21'), ('JavaScript', 'left-pad', 'unknown')]
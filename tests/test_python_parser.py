@@ -0,0 +1,19 @@
+import pytest
+
+from parsers.python_parser import PythonParser
+
+
+@pytest.mark.parametrize('include, constraint', [
+    ('-rbase.txt', '-cconstraints.txt'),
+    ('-r base.txt', '-c constraints.txt'),
+    ('--requirement=base.txt', '--constraint constraints.txt'),
+])
+def test_requirement_includes_and_constraints(tmp_path, include, constraint):
+    (tmp_path / 'base.txt').write_text('requests==2.31.0\n')
+    (tmp_path / 'constraints.txt').write_text('six==1.16.0\n')
+    requirements = tmp_path / 'requirements.txt'
+    requirements.write_text(f"{include}\n{constraint}\nsix\n")
+
+    dependencies = PythonParser(str(tmp_path)).parse_dependencies(str(requirements))
+
+    assert sorted(dependencies) == [('Python', 'requests', '2.31.0'), ('Python', 'six', '1.16.0')]
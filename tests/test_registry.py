@@ -0,0 +1,66 @@
+import json
+import os
+from importlib.metadata import EntryPoint
+from typing import List, Tuple
+
+import pytest
+
+import parsers.registry
+from helpers.scanner import RepositoryScanner
+from parsers.base_parser import Parser
+from parsers.registry import ENTRY_POINT_GROUP, ParserRegistry
+
+
+class SwiftParser(Parser):
+
+    dependency_files = ['Package.resolved']
+    extensions = ['.swift']
+
+    def find_dependency_files(self) -> List[str]:
+        return self.file_index.find(self.dependency_files)
+
+    def parse_dependencies(self, file_path: str) -> List[Tuple[str, str, str]]:
+        with open(file_path, 'r') as file:
+            pins = json.load(file)['pins']
+
+        return [('Swift', pin['identity'], pin['state']['version']) for pin in pins]
+
+
+@pytest.fixture
+def swift_registry(monkeypatch):
+    entry_point = EntryPoint(name='Swift', value=f"{__name__}:SwiftParser", group=ENTRY_POINT_GROUP)
+    monkeypatch.setattr(parsers.registry, 'entry_points',
+                        lambda group: [entry_point] if group == ENTRY_POINT_GROUP else [])
+
+    return ParserRegistry(parsers={})
+
+
+def _write(path, content: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def test_plugin_declares_files_and_extensions(swift_registry):
+    assert swift_registry.dependency_files() == {'Swift': ['Package.resolved']}
+    assert swift_registry.extension_languages() == {'.swift': 'Swift'}
+
+
+def test_plugin_finds_its_files(swift_registry, tmp_path):
+    _write(tmp_path / 'App' / 'main.swift', 'print("hi")\n')
+    _write(tmp_path / 'App' / 'Package.resolved',
+           json.dumps({'pins': [{'identity': 'swift-nio', 'state': {'version': '2.62.0'}}]}))
+
+    scanner = RepositoryScanner(str(tmp_path), registry=swift_registry)
+
+    assert scanner.scan_languages() == {'Swift': 1}
+    assert scanner.scan_dependencies() == [('Swift', 'swift-nio', '2.62.0')]
+
+
+def test_plugin_skipped_when_language_absent(swift_registry, tmp_path):
+    _write(tmp_path / 'Package.resolved', json.dumps({'pins': []}))
+
+    scanner = RepositoryScanner(str(tmp_path), registry=swift_registry)
+    scanner.scan_languages()
+
+    assert scanner.get_language_parsers() == {}
@@ -0,0 +1,59 @@
+import json
+
+from helpers.runner import run_scan
+from parsers.ruby_parcer import RubyParser
+
+GEMFILE_LOCK = """PATH
+  remote: engines/engine
+  specs:
+    engine (0.1.0)
+      rails-html-sanitizer (>= 1.0)
+
+GEM
+  remote: https://rubygems.org/
+  specs:
+    nokogiri (1.15.4-arm64-darwin)
+      racc (~> 1.4)
+    nokogiri (1.15.4-x86_64-linux)
+      racc (~> 1.4)
+    racc (1.7.1)
+    rails-html-sanitizer (1.6.0)
+      loofah (~> 2.21)
+      nokogiri (~> 1.14)
+
+PLATFORMS
+  arm64-darwin
+  x86_64-linux
+
+DEPENDENCIES
+  engine!
+  rails-html-sanitizer
+"""
+
+
+def test_gemfile_lock_specs_and_edges(tmp_path):
+    lock_path = tmp_path / 'Gemfile.lock'
+    lock_path.write_text(GEMFILE_LOCK)
+    parser = RubyParser(str(tmp_path))
+
+    assert parser.parse_dependencies(str(lock_path)) == [
+        ('Ruby', 'nokogiri', '1.15.4'), ('Ruby', 'racc', '1.7.1'), ('Ruby', 'rails-html-sanitizer', '1.6.0')]
+    # loofah is not locked and the PATH gem is the repository itself
+    assert parser.dependency_edges(str(lock_path)) == [
+        (('Ruby', 'nokogiri', '1.15.4'), ('Ruby', 'racc', '1.7.1')),
+        (('Ruby', 'rails-html-sanitizer', '1.6.0'), ('Ruby', 'nokogiri', '1.15.4'))]
+
+
+def test_edges_in_bom(tmp_path):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    (repo / 'app.rb').write_text('puts 1\n')
+    (repo / 'Gemfile.lock').write_text(GEMFILE_LOCK)
+    output_path = tmp_path / 'bom.json'
+
+    run_scan(str(repo), str(output_path), compact=True)
+
+    with open(output_path, 'r') as file:
+        assert json.load(file)['dependencies'] == [
+            {'ref': 'pkg:ruby/nokogiri@1.15.4', 'dependsOn': ['pkg:ruby/racc@1.7.1']},
+            {'ref': 'pkg:ruby/rails-html-sanitizer@1.6.0', 'dependsOn': ['pkg:ruby/nokogiri@1.15.4']}]